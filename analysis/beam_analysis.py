@@ -41,6 +41,18 @@ import numpy as np
 from dataclasses import dataclass
 
 
+def _cumulative_trapezoid(y: np.ndarray, dx: float) -> np.ndarray:
+    """
+    Cumulative trapezoidal integral of y on a uniform grid, starting from 0.
+
+    Same recurrence as out[i] = out[i-1] + (y[i-1] + y[i]) * dx / 2, evaluated
+    with a single cumsum instead of a Python loop.
+    """
+    out = np.zeros_like(y)
+    np.cumsum((y[:-1] + y[1:]) * dx / 2.0, out=out[1:])
+    return out
+
+
 def compute_wind_barrier_uniform_and_point(
     span_mm: float,
     loads: List,
@@ -108,28 +120,20 @@ def compute_wind_barrier_uniform_and_point(
     else:
         RA = RB = 0.0
 
-    # Compute shear force V(x)
-    V = np.zeros_like(x_m)
-
-    for i, x in enumerate(x_m):
-        V[i] = RA
+    # Compute shear force V(x) - vectorised over x, one pass per load
+    V = np.full_like(x_m, RA)
 
-        # Subtract contribution from uniform loads
-        for w in uniform_loads:
-            V[i] -= w * x
+    # Subtract contribution from uniform loads
+    for w in uniform_loads:
+        V -= w * x_m
 
-        # Subtract point loads that have been passed
-        for P, a in point_loads:
-            if x >= a:
-                V[i] -= P
+    # Subtract point loads that have been passed
+    for P, a in point_loads:
+        V[x_m >= a] -= P
 
     # Compute bending moment M(x) by integrating V(x)
     dx = x_m[1] - x_m[0]
-    M = np.zeros_like(x_m)
-    M[0] = 0.0
-
-    for i in range(1, len(x_m)):
-        M[i] = M[i-1] + (V[i-1] + V[i]) * dx / 2.0
+    M = _cumulative_trapezoid(V, dx)
 
     return {
         'x_m': x_m,
@@ -178,16 +182,10 @@ def compute_deflection_from_M(
     
     # First integration: slope θ(x) = ∫κ dx
     dx = x_m[1] - x_m[0]
-    theta = np.zeros_like(x_m)
-    
-    for i in range(1, len(x_m)):
-        theta[i] = theta[i-1] + (kappa[i-1] + kappa[i]) * dx / 2.0
+    theta = _cumulative_trapezoid(kappa, dx)
     
     # Second integration: v(x) = ∫θ dx
-    v_raw = np.zeros_like(x_m)
-    
-    for i in range(1, len(x_m)):
-        v_raw[i] = v_raw[i-1] + (theta[i-1] + theta[i]) * dx / 2.0
+    v_raw = _cumulative_trapezoid(theta, dx)
     
     # Apply boundary conditions: v(0) = 0, v(L) = 0
     C2 = -v_raw[0]
@@ -236,6 +234,62 @@ def apply_load_factors(loads: List, wind_factor: float, barrier_factor: float) -
     return factored_loads
 
 
+def _split_loads_by_kind(loads: List) -> Tuple[List, List, List]:
+    """
+    Split loads into (wind, barrier, other) groups.
+
+    Uses the same kind test as apply_load_factors, so 'other' holds the loads
+    that are never factored.
+    """
+    wind, barrier, other = [], [], []
+    for load in loads:
+        kind = str(getattr(load, 'kind', '')).upper()
+        if 'WIND' in kind:
+            wind.append(load)
+        elif 'BARRIER' in kind:
+            barrier.append(load)
+        else:
+            other.append(load)
+    return wind, barrier, other
+
+
+def _component_responses(span_mm: float, loads: List, n_points: int) -> Dict[str, np.ndarray]:
+    """
+    Unfactored response of each load group, stacked as rows (wind, barrier, other).
+
+    Beam response is linear in load magnitude, so the response for any load
+    case is F @ rows with F = [wind_factor, barrier_factor, 1.0].
+    """
+    analyses = [
+        compute_wind_barrier_uniform_and_point(span_mm=span_mm, loads=group, n_points=n_points)
+        for group in _split_loads_by_kind(loads)
+    ]
+    return {
+        'x_m': analyses[0]['x_m'],
+        'V': np.vstack([a['V'] for a in analyses]),
+        'M': np.vstack([a['M'] for a in analyses]),
+        'R': np.array([[a['RA'], a['RB']] for a in analyses], dtype=float)
+    }
+
+
+def _case_factor_matrix(cases: List) -> np.ndarray:
+    """Stack load case partial factors as rows of [wind_factor, barrier_factor, 1.0]."""
+    return np.array(
+        [[case.wind_factor, case.barrier_factor, 1.0] for case in cases],
+        dtype=float
+    ).reshape(-1, 3)
+
+
+def _governing(names: List[str], values: np.ndarray) -> Tuple[Optional[str], float]:
+    """First case with the largest positive value, or (None, 0.0) if none is positive."""
+    if len(values) == 0:
+        return None, 0.0
+    k = int(np.argmax(values))
+    if values[k] > 0:
+        return names[k], float(values[k])
+    return None, 0.0
+
+
 def analyze_uls_cases(
     geom,
     loading_inputs,
@@ -261,15 +315,18 @@ def analyze_uls_cases(
     --------
     Dict with structure:
     {
+        'x_m': array (sampling grid shared by every case),
         'cases': {
             'case_name_1': {
-                'x_m': array,
                 'V_N': array,
                 'M_Nm': array,
                 'RA_N': float,
                 'RB_N': float,
                 'M_max_Nm': float,
-                'V_max_N': float
+                'V_max_N': float,
+                'x_Mmax_m': float,
+                'x_Vmax_m': float,
+                'RA_kN', 'RB_kN', 'M_max_kNm', 'V_max_kN': float (display units)
             },
             ...
         },
@@ -277,8 +334,12 @@ def analyze_uls_cases(
             'M_max': ('case_name', value),
             'V_max': ('case_name', value),
             'case_M': 'case_name',
-            'case_V': 'case_name'
-        }
+            'case_V': 'case_name',
+            'M_max_kNm': float,
+            'V_max_kN': float
+        },
+        'case_names': ('case_name_1', ...),
+        'case_index': {'case_name_1': 0, ...}
     }
     """
     base_loads = loading_inputs.to_loads()
@@ -288,65 +349,71 @@ def analyze_uls_cases(
         'governing': {}
     }
     
-    M_max_overall = 0.0
-    M_max_case = None
-    V_max_overall = 0.0
-    V_max_case = None
-    
-    for case in load_case_set.uls_cases:
-        # Apply load factors
-        factored_loads = apply_load_factors(
-            base_loads,
-            case.wind_factor,
-            case.barrier_factor
-        )
-        
-        # Analyze this case
-        analysis = compute_wind_barrier_uniform_and_point(
-            span_mm=geom.span_mm,
-            loads=factored_loads,
-            n_points=n_points
-        )
-        
-        # Find max values
-        M_abs = np.abs(analysis['M'])
-        V_abs = np.abs(analysis['V'])
-        
-        M_max = np.max(M_abs)
-        V_max = np.max(V_abs)
-        
-        x_Mmax = analysis['x_m'][np.argmax(M_abs)]
-        x_Vmax = analysis['x_m'][np.argmax(V_abs)]
-        
-        # Store case results
-        results['cases'][case.name] = {
-            'x_m': analysis['x_m'],
-            'V_N': analysis['V'],
-            'M_Nm': analysis['M'],
-            'RA_N': analysis['RA'],
-            'RB_N': analysis['RB'],
-            'M_max_Nm': M_max,
-            'V_max_N': V_max,
-            'x_Mmax_m': x_Mmax,
-            'x_Vmax_m': x_Vmax
+    cases = load_case_set.uls_cases
+    names = [case.name for case in cases]
+    
+    # Solve each load group once, then combine all cases in one matmul
+    comp = _component_responses(geom.span_mm, base_loads, n_points)
+    x_m = comp['x_m']
+    results['x_m'] = x_m
+    F = _case_factor_matrix(cases)
+    V_all = F @ comp['V']
+    M_all = F @ comp['M']
+    R_all = F @ comp['R']
+    
+    # Find max values for every case at once
+    rows = np.arange(len(cases))
+    M_abs = np.abs(M_all)
+    V_abs = np.abs(V_all)
+    i_M = M_abs.argmax(axis=1)
+    i_V = V_abs.argmax(axis=1)
+    M_max = M_abs[rows, i_M]
+    V_max = V_abs[rows, i_V]
+    
+    # Store case results
+    for k, name in enumerate(names):
+        results['cases'][name] = {
+            'V_N': V_all[k],
+            'M_Nm': M_all[k],
+            'RA_N': float(R_all[k, 0]),
+            'RB_N': float(R_all[k, 1]),
+            'M_max_Nm': float(M_max[k]),
+            'V_max_N': float(V_max[k]),
+            'x_Mmax_m': float(x_m[i_M[k]]),
+            'x_Vmax_m': float(x_m[i_V[k]])
         }
-        
-        # Track governing
-        if M_max > M_max_overall:
-            M_max_overall = M_max
-            M_max_case = case.name
-        
-        if V_max > V_max_overall:
-            V_max_overall = V_max
-            V_max_case = case.name
+    
+    # Track governing
+    M_max_case, M_max_overall = _governing(names, M_max)
+    V_max_case, V_max_overall = _governing(names, V_max)
     
     results['governing'] = {
         'M_max': (M_max_case, M_max_overall),
         'V_max': (V_max_case, V_max_overall),
         'case_M': M_max_case,
-        'case_V': V_max_case
+        'case_V': V_max_case,
+        'M_max_kNm': M_max_overall / 1000,
+        'V_max_kN': V_max_overall / 1000
     }
     
+    # Display-ready kN / kN·m values, scaled in one pass so the UI and the
+    # JSON export read them directly instead of rescaling per use. Divided
+    # rather than scaled by 1e-3 so they round exactly like N / 1000
+    cases = results['cases']
+    scaled = (np.array(
+        [[c['RA_N'], c['RB_N'], c['M_max_Nm'], c['V_max_N']] for c in cases.values()],
+        dtype=float
+    ).reshape(-1, 4) / 1000.0).tolist()
+    for case_data, (RA_kN, RB_kN, M_max_kNm, V_max_kN) in zip(cases.values(), scaled):
+        case_data['RA_kN'] = RA_kN
+        case_data['RB_kN'] = RB_kN
+        case_data['M_max_kNm'] = M_max_kNm
+        case_data['V_max_kN'] = V_max_kN
+    
+    # Case order and name -> position lookup for UI selectors
+    results['case_names'] = tuple(cases)
+    results['case_index'] = {name: i for i, name in enumerate(results['case_names'])}
+    
     return results
 
 
@@ -389,14 +456,16 @@ def analyze_sls_deflection_requirement(
         'cases': {
             'case_name_1': {
                 'I_req_m4': float,
-                'v_unit_max_m': float (deflection with I=1.0)
+                'I_req_cm4': float (display units)
             },
             ...
         },
         'governing': {
             'I_req_m4': float (maximum required I),
+            'I_req_cm4': float,
             'case': 'case_name',
-            'v_limit_m': float
+            'v_limit_m': float,
+            'v_limit_mm': float
         }
     }
     """
@@ -408,57 +477,44 @@ def analyze_sls_deflection_requirement(
         'governing': {}
     }
     
-    I_req_max = 0.0
-    I_req_case = None
+    cases = load_case_set.sls_cases
+    names = [case.name for case in cases]
+    
+    # Unit deflection (I = 1.0 m^4) of each load group; deflection is linear
+    # in M, so every case is one row of F @ v_comp
+    comp = _component_responses(geom.span_mm, base_loads, n_points)
+    I_unit = 1.0
+    v_comp = np.vstack([
+        compute_deflection_from_M(x_m=comp['x_m'], M=M, E=E, I=I_unit)[0]
+        for M in comp['M']
+    ])
+    v_unit_all = _case_factor_matrix(cases) @ v_comp
+    
+    # Find max deflection per case
+    v_unit_max = np.abs(v_unit_all).max(axis=1, initial=0.0)
+    
+    # Calculate required I to meet deflection limit
+    # v_actual = v_unit / I_req
+    # v_actual = v_limit
+    # => I_req = v_unit / v_limit
+    if v_limit_m > 0:
+        I_req = np.where(v_unit_max > 0, v_unit_max / v_limit_m, 0.0)
+    else:
+        I_req = np.zeros_like(v_unit_max)
     
-    for case in load_case_set.sls_cases:
-        # Apply load factors
-        factored_loads = apply_load_factors(
-            base_loads,
-            case.wind_factor,
-            case.barrier_factor
-        )
-        
-        # Get moment diagram
-        analysis = compute_wind_barrier_uniform_and_point(
-            span_mm=geom.span_mm,
-            loads=factored_loads,
-            n_points=n_points
-        )
-        
-        # Compute deflection with I = 1.0 m^4 (unit deflection)
-        I_unit = 1.0
-        v_unit, _, _ = compute_deflection_from_M(
-            x_m=analysis['x_m'],
-            M=analysis['M'],
-            E=E,
-            I=I_unit
-        )
-        
-        # Find max deflection
-        v_unit_max = np.max(np.abs(v_unit))
-        
-        # Calculate required I to meet deflection limit
-        # v_actual = v_unit / I_req
-        # v_actual = v_limit
-        # => I_req = v_unit / v_limit
-        if v_limit_m > 0 and v_unit_max > 0:
-            I_req = v_unit_max / v_limit_m
-        else:
-            I_req = 0.0
-        
-        # Store case results
-        results['cases'][case.name] = {
-            'I_req_m4': I_req,
+    # Store case results
+    for name, I_req_case_m4 in zip(names, I_req.tolist()):
+        results['cases'][name] = {
+            'I_req_m4': I_req_case_m4,
+            'I_req_cm4': I_req_case_m4 * 1e8,
         }
-        
-        # Track governing (maximum required I)
-        if I_req > I_req_max:
-            I_req_max = I_req
-            I_req_case = case.name
+    
+    # Track governing (maximum required I)
+    I_req_case, I_req_max = _governing(names, I_req)
     
     results['governing'] = {
         'I_req_m4': I_req_max,
+        'I_req_cm4': I_req_max * 1e8,
         'case': I_req_case,
         'v_limit_m': v_limit_m,
         'v_limit_mm': deflection_limit_mm
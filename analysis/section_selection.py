@@ -17,7 +17,11 @@ TT_Orange = 'rgb(211,69,29)'
 TT_Grey = 'rgb(99,102,105)'
 
 
-def load_section_database(material: str, excel_path: str = "data/mullion_profile_db.xlsx") -> pd.DataFrame:
+def load_section_database(
+    material: str,
+    excel_path: str = "data/mullion_profile_db.xlsx",
+    sheets: Optional[Dict[str, pd.DataFrame]] = None
+) -> pd.DataFrame:
     """
     Load section database from Excel file - CACHED VERSION.
     
@@ -27,6 +31,9 @@ def load_section_database(material: str, excel_path: str = "data/mullion_profile
         Material type ("Aluminium" or "Steel")
     excel_path : str
         Path to Excel database file
+    sheets : Dict[str, pd.DataFrame], optional
+        Already-parsed workbook (sheet name -> DataFrame). If given, the
+        material sheet is taken from here instead of re-reading the file.
         
     Returns
     -------
@@ -42,7 +49,10 @@ def load_section_database(material: str, excel_path: str = "data/mullion_profile
     sheet_name = "aluminium" if material.lower() == "aluminium" else "steel"
     
     try:
-        df = pd.read_excel(excel_path, sheet_name=sheet_name, engine="openpyxl")
+        if sheets is not None:
+            df = sheets[sheet_name]
+        else:
+            df = pd.read_excel(excel_path, sheet_name=sheet_name, engine="openpyxl")
     except Exception as e:
         if st:
             st.error(f"Error reading Excel file: {e}")
@@ -138,11 +148,11 @@ def generate_uls_plot(
     go.Figure
         Plotly figure
     """
-    depths = df['D'].values
-    Z_available = df['Z'].values  # Already in cm³
-    reinf = df['REINF'].values
-    profiles = df['NAME'].values
-    suppliers = df['SUPPLIER'].values
+    depths = df['D'].to_numpy(copy=False)
+    Z_available = df['Z'].to_numpy(copy=False)  # Already in cm³
+    reinf = df['REINF'].to_numpy(copy=False)
+    profiles = df['NAME'].to_numpy(copy=False)
+    suppliers = df['SUPPLIER'].to_numpy(copy=False)
     
     # Determine pass/fail
     uls_passed = Z_available >= Z_req_cm3
@@ -260,11 +270,11 @@ def generate_sls_plot(
     go.Figure
         Plotly figure
     """
-    depths = df['D'].values
-    I_available = df['I'].values  # Already in cm⁴
-    reinf = df['REINF'].values
-    profiles = df['NAME'].values
-    suppliers = df['SUPPLIER'].values
+    depths = df['D'].to_numpy(copy=False)
+    I_available = df['I'].to_numpy(copy=False)  # Already in cm⁴
+    reinf = df['REINF'].to_numpy(copy=False)
+    profiles = df['NAME'].to_numpy(copy=False)
+    suppliers = df['SUPPLIER'].to_numpy(copy=False)
     
     # Determine pass/fail
     sls_passed = I_available >= I_req_cm4
@@ -376,11 +386,11 @@ def generate_utilisation_plot(
     Tuple[go.Figure, Optional[str]]
         Plotly figure and recommended profile text
     """
-    depths = df['D'].values
-    Z_available = df['Z'].values
-    I_available = df['I'].values
-    profiles = df['NAME'].values
-    suppliers = df['SUPPLIER'].values
+    depths = df['D'].to_numpy(copy=False)
+    Z_available = df['Z'].to_numpy(copy=False)
+    I_available = df['I'].to_numpy(copy=False)
+    profiles = df['NAME'].to_numpy(copy=False)
+    suppliers = df['SUPPLIER'].to_numpy(copy=False)
     
     # Calculate utilisations
     uls_util = []
@@ -502,10 +512,14 @@ def generate_section_table(
     """
     df_table = df.copy()
     
-    # Calculate utilisations
-    df_table['ULS Utilisation'] = Z_req_cm3 / df_table['Z']
-    df_table['SLS Utilisation'] = I_req_cm4 / df_table['I']
-    df_table['Max Utilisation'] = df_table[['ULS Utilisation', 'SLS Utilisation']].max(axis=1)
+    # Calculate utilisations on the raw arrays (skips Series alignment)
+    z = df_table['Z'].to_numpy(copy=False)
+    i = df_table['I'].to_numpy(copy=False)
+    uls_util = Z_req_cm3 / z
+    sls_util = I_req_cm4 / i
+    df_table['ULS Utilisation'] = uls_util
+    df_table['SLS Utilisation'] = sls_util
+    df_table['Max Utilisation'] = np.maximum(uls_util, sls_util)
     
     # Separate passing and failing
     df_pass = df_table[df_table['Max Utilisation'] <= 1.0].copy()
@@ -602,26 +616,41 @@ def section_selection_ui(
     if geometry_info is None:
         geometry_info = {'span_mm': 0, 'bay_width_mm': 0}
     
-    # CACHED DATABASE LOADING - Only reads once per material+path combination
-    @st.cache_data(show_spinner="Loading section database...")
-    def cached_load_database(material: str, excel_path: str) -> pd.DataFrame:
+    # CACHED WORKBOOK PARSE - every sheet read once per file version (mtime),
+    # shared across sessions; editing the workbook invalidates it
+    @st.cache_resource(show_spinner="Loading section database...")
+    def cached_read_workbook(excel_path: str, mtime: float) -> Dict[str, pd.DataFrame]:
+        """Parse all sheets of the section workbook"""
+        return pd.read_excel(excel_path, sheet_name=None, engine="openpyxl")
+    
+    # CACHED DATABASE LOADING - Only cleaned once per material+file version
+    @st.cache_data(show_spinner=False)
+    def cached_load_database(material: str, excel_path: str, mtime: float) -> pd.DataFrame:
         """Cached version of load_section_database"""
-        return load_section_database(material, excel_path)
+        return load_section_database(material, excel_path, sheets=cached_read_workbook(excel_path, mtime))
+    
+    @st.cache_data(show_spinner=False)
+    def cached_supplier_options(material: str, excel_path: str, mtime: float) -> List[str]:
+        """Cached sorted supplier list for the filter widget"""
+        return sorted(cached_load_database(material, excel_path, mtime)['SUPPLIER'].unique())
     
     # Load section database (cached!)
     try:
-        df_all = cached_load_database(material, excel_path)
+        mtime = Path(excel_path).stat().st_mtime
+        df_all = cached_load_database(material, excel_path, mtime)
     except Exception as e:
         parent.error(f"Failed to load section database: {e}")
         return
     
-    # Get unique suppliers
-    all_suppliers = sorted(df_all['SUPPLIER'].unique())
+    # Get unique suppliers (cached alongside the database)
+    all_suppliers = cached_supplier_options(material, excel_path, mtime)
     
     # Filters in sidebar or expander
     parent.markdown("#### Filters")
     
-    filter_col1, filter_col2 = parent.columns(2)
+    # Single layout pass: supplier filter on the left half, reinforcement
+    # checkboxes sharing the right half
+    filter_col1, col_a, col_b = parent.columns([2, 1, 1])
     
     with filter_col1:
         selected_suppliers = parent.multiselect(
@@ -631,20 +660,18 @@ def section_selection_ui(
             help="Filter sections by supplier"
         )
     
-    with filter_col2:
-        col_a, col_b = parent.columns(2)
-        with col_a:
-            include_reinf = parent.checkbox(
-                "Include Reinforced",
-                value=True,
-                help="Include sections with reinforcement"
-            )
-        with col_b:
-            include_unreinf = parent.checkbox(
-                "Include Unreinforced",
-                value=True,
-                help="Include sections without reinforcement"
-            )
+    with col_a:
+        include_reinf = parent.checkbox(
+            "Include Reinforced",
+            value=True,
+            help="Include sections with reinforcement"
+        )
+    with col_b:
+        include_unreinf = parent.checkbox(
+            "Include Unreinforced",
+            value=True,
+            help="Include sections without reinforcement"
+        )
     
     # Filter database
     df_filtered = filter_section_database(
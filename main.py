@@ -1,3 +1,4 @@
+from dataclasses import astuple
 import streamlit as st
 import st_yled
 from auth import authenticate_user
@@ -12,6 +13,7 @@ from outputs.pdf_download import add_pdf_download_button
 
 import plotly.graph_objects as go
 import numpy as np
+import pandas as pd
 # Initialize st_yled 
 st_yled.init()
 
@@ -41,17 +43,13 @@ mat = material_ui(container=st, key_prefix="main_mat", default_type=MaterialType
 st.markdown("---")
 
 st.header("Loading")
-# Get geometry from session state using the CORRECT keys with the key_prefix
-span_mm = st.session_state.inputs.get("main_geom_span_mm", 3000.0)
-bay_width_mm = st.session_state.inputs.get("main_geom_bay_width_mm", 1000.0)
-
-# Get loading inputs (only call once)
-loading_inputs = loading_ui(container=st, key_prefix="main_load", bay_width_mm=bay_width_mm)
+# Get loading inputs (only call once) - geometry straight from geom, no session-state round-trip
+loading_inputs = loading_ui(container=st, key_prefix="main_load", bay_width_mm=geom.bay_width_mm)
 
 # Display diagram using the same loading_inputs
-loading_diagram_ui(container=st,key_prefix="main_load",span_mm=span_mm,bay_width_mm=bay_width_mm,loading_inputs=loading_inputs)
+loading_diagram_ui(container=st,key_prefix="main_load",span_mm=geom.span_mm,bay_width_mm=geom.bay_width_mm,loading_inputs=loading_inputs)
 # Display diagram using the same loading_inputs
-beam_model_diagram_ui(span_mm=span_mm,loading_inputs=loading_inputs)
+beam_model_diagram_ui(span_mm=geom.span_mm,loading_inputs=loading_inputs)
 st.markdown("---")
 
 st.header("Load Cases")
@@ -138,10 +136,15 @@ st.markdown("---")
 def cached_uls_analysis(
     span_mm: float,
     bay_width_mm: float,
-    loading_inputs_hash: str, load_cases_hash: str, _geom, _loading_inputs, _load_case_set):
+    loading_inputs_key: tuple,
+    uls_cases_key: tuple,
+    _geom,
+    _loading_inputs,
+    _load_case_set
+):
     """
     Cached ULS analysis with hashable parameters.
-    Uses simple values for cache key, passes objects for computation.
+    Uses primitive tuples for cache key, passes objects for computation.
     """
     return analyze_uls_cases(_geom, _loading_inputs, _load_case_set)
 
@@ -149,8 +152,8 @@ def cached_uls_analysis(
 def cached_sls_analysis(
     span_mm: float,
     bay_width_mm: float,
-    loading_inputs_hash: str,
-    load_cases_hash: str,
+    loading_inputs_key: tuple,
+    sls_cases_key: tuple,
     E: float,
     deflection_limit_mm: float,
     _geom,
@@ -159,23 +162,201 @@ def cached_sls_analysis(
 ):
     """
     Cached SLS analysis with hashable parameters.
-    Uses simple values for cache key, passes objects for computation.
+    Uses primitive tuples for cache key, passes objects for computation.
     """
     return analyze_sls_deflection_requirement(_geom, _loading_inputs, _load_case_set, E, deflection_limit_mm)
 
+@st.cache_data(show_spinner=False)
+def cached_design_json(
+    geom_key: tuple,
+    mat_key: tuple,
+    loading_inputs_key: tuple,
+    uls_cases_key: tuple,
+    sls_cases_key: tuple,
+    deflection_limit_mm: float,
+    deflection_criteria: str,
+    safety_factor: float,
+    sigma_allow_Pa: float,
+    Z_req: float,
+    I_req: float,
+    _geom,
+    _mat,
+    _loading_inputs,
+    _load_case_set,
+    _uls_results,
+    _sls_results
+):
+    """
+    Cached design JSON with hashable parameters.
+    The results dicts are fully determined by the other keys, so they are
+    passed unhashed; unchanged reruns reuse the previous dict.
+    The cache is shared by every session, so the dict carries no generation
+    time; each export stamps its own with stamp_report_generated().
+    """
+    return create_design_json(
+        geom=_geom,
+        mat=_mat,
+        loading_inputs=_loading_inputs,
+        load_case_set=_load_case_set,
+        deflection_limit_mm=deflection_limit_mm,
+        deflection_criteria=deflection_criteria,
+        safety_factor=safety_factor,
+        sigma_allow_Pa=sigma_allow_Pa,
+        uls_results=_uls_results,
+        sls_results=_sls_results,
+        Z_req=Z_req,
+        I_req=I_req,
+        include_timestamp=False
+    )
+
+def _load_cases_key(cases) -> tuple:
+    """Hashable snapshot of a list of LoadCombination objects."""
+    return tuple((case.name, case.wind_factor, case.barrier_factor) for case in cases)
+
+# ========== CACHED PLOT FUNCTIONS ==========
+# Static-style diagrams: no mode bar and no responsive relayout (width is
+# already set by the container), which cuts per-chart JS work
+DIAGRAM_PLOT_CONFIG = {'displayModeBar': False, 'responsive': False, 'staticPlot': False}
+
+@st.cache_data(show_spinner=False)
+def build_shear_fig(case_name: str, uls_key: tuple, _x_m: np.ndarray, _V_N: np.ndarray) -> dict:
+    """
+    Build the shear force diagram for one ULS case.
+    Returned as a figure dict so reruns with the same case skip Plotly's layout builder.
+    Keyed on the case name and the ULS analysis inputs (uls_key), which fully
+    determine the arrays, so the arrays themselves are never hashed.
+    """
+    # Display-only precision: float32 halves the payload sent to the browser
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(
+        x=_x_m.astype(np.float32),
+        y=(_V_N/1000).astype(np.float32),
+        mode='lines',
+        name='Shear Force',
+        line=dict(color='#e74c3c', width=2),
+        fill='tozeroy',
+        fillcolor='rgba(231, 76, 60, 0.2)'
+    ))
+
+    fig.add_hline(y=0, line_dash="dash", line_color="gray", opacity=0.5)
+
+    fig.update_layout(
+        title=f"Shear Force Diagram - {case_name}",
+        xaxis_title="Position along span (m)",
+        yaxis_title="Shear Force (kN)",
+        height=400,
+        showlegend=False
+    )
+    return fig.to_dict()
+
+@st.cache_data(show_spinner=False)
+def build_moment_fig(case_name: str, uls_key: tuple, _x_m: np.ndarray, _M_Nm: np.ndarray) -> dict:
+    """
+    Build the bending moment diagram for one ULS case.
+    Returned as a figure dict so reruns with the same case skip Plotly's layout builder.
+    Keyed on the case name and the ULS analysis inputs (uls_key), which fully
+    determine the arrays, so the arrays themselves are never hashed.
+    """
+    # Display-only precision: float32 halves the payload sent to the browser
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(
+        x=_x_m.astype(np.float32),
+        y=(_M_Nm/1000).astype(np.float32),
+        mode='lines',
+        name='Bending Moment',
+        line=dict(color='#3498db', width=2),
+        fill='tozeroy',
+        fillcolor='rgba(52, 152, 219, 0.2)'
+    ))
+
+    fig.add_hline(y=0, line_dash="dash", line_color="gray", opacity=0.5)
+
+    fig.update_layout(
+        title=f"Bending Moment Diagram - {case_name}",
+        xaxis_title="Position along span (m)",
+        yaxis_title="Bending Moment (kN·m)",
+        height=400,
+        showlegend=False
+    )
+    return fig.to_dict()
+
+# ========== DISPLAY HELPERS ==========
+def _fmt(value: float, unit: str, digits: int = 2) -> str:
+    """Format a metric value with its unit, e.g. _fmt(9.0, "kN") -> "9.00 kN"."""
+    return f"{value:.{digits}f} {unit}"
+
+# ========== DIAGRAM FRAGMENTS ==========
+# Each diagram is a fragment so changing its case selector only reruns that
+# block, not the whole page (inputs, analysis, exports)
+@st.fragment
+def shear_diagram_block(uls_results: dict, uls_key: tuple, gov_V_case: str):
+    """Case selector, shear force diagram and max-V metrics for one ULS case."""
+    # Case selector - default to governing
+    case_options = uls_results['case_names']
+    default_V_idx = uls_results['case_index'].get(gov_V_case, 0)
+
+    selected_V_case = st.selectbox(
+        "Select ULS case for shear diagram:",
+        options=case_options,
+        index=default_V_idx,
+        key="uls_V_selector"
+    )
+
+    # Plot shear diagram
+    V_data = uls_results['cases'][selected_V_case]
+    fig_V = go.Figure(build_shear_fig(selected_V_case, uls_key, uls_results['x_m'], V_data['V_N']))
+    st.plotly_chart(fig_V, width='stretch', config=DIAGRAM_PLOT_CONFIG)
+
+    # Show max value for selected case
+    col1, col2 = st.columns(2)
+    with col1:
+        st.metric("Max V (this case)", _fmt(V_data['V_max_kN'], "kN"))
+    with col2:
+        st.metric("Location", _fmt(V_data['x_Vmax_m'], "m", 3))
+
+@st.fragment
+def moment_diagram_block(uls_results: dict, uls_key: tuple, gov_M_case: str):
+    """Case selector, bending moment diagram and max-M metrics for one ULS case."""
+    # Case selector - default to governing
+    case_options = uls_results['case_names']
+    default_M_idx = uls_results['case_index'].get(gov_M_case, 0)
+
+    selected_M_case = st.selectbox(
+        "Select ULS case for moment diagram:",
+        options=case_options,
+        index=default_M_idx,
+        key="uls_M_selector"
+    )
+
+    # Plot moment diagram
+    M_data = uls_results['cases'][selected_M_case]
+    fig_M = go.Figure(build_moment_fig(selected_M_case, uls_key, uls_results['x_m'], M_data['M_Nm']))
+    st.plotly_chart(fig_M, width='stretch', config=DIAGRAM_PLOT_CONFIG)
+
+    # Show max value for selected case
+    col1, col2 = st.columns(2)
+    with col1:
+        st.metric("Max M (this case)", _fmt(M_data['M_max_kNm'], "kN·m"))
+    with col2:
+        st.metric("Location", _fmt(M_data['x_Mmax_m'], "m", 3))
+
 # ========== ANALYSIS ==========
 st.header("Results")
 
-# Create hash strings for caching - these change when the objects change
-loading_inputs_hash = str(vars(loading_inputs))
-load_cases_hash = f"{len(load_case_set.uls_cases)}_{len(load_case_set.sls_cases)}"
+# Cache keys - built from every input field so editing any value (including a
+# single load factor) invalidates the cached results
+loading_inputs_key = astuple(loading_inputs)
+uls_cases_key = _load_cases_key(load_case_set.uls_cases)
+sls_cases_key = _load_cases_key(load_case_set.sls_cases)
+# Everything the ULS arrays depend on - cheap key for the cached diagram builders
+uls_key = (geom.span_mm, geom.bay_width_mm, loading_inputs_key, uls_cases_key)
 
 with st.spinner("⏳ Analyzing load cases..."):
     uls_results = cached_uls_analysis(
         geom.span_mm,
         geom.bay_width_mm,
-        loading_inputs_hash,
-        load_cases_hash,
+        loading_inputs_key,
+        uls_cases_key,
         geom,
         loading_inputs,
         load_case_set
@@ -183,8 +364,8 @@ with st.spinner("⏳ Analyzing load cases..."):
     sls_results = cached_sls_analysis(
         geom.span_mm,
         geom.bay_width_mm,
-        loading_inputs_hash,
-        load_cases_hash,
+        loading_inputs_key,
+        sls_cases_key,
         mat.E,
         deflection_limit_mm,
         geom,
@@ -192,6 +373,26 @@ with st.spinner("⏳ Analyzing load cases..."):
         load_case_set
     )
 
+# ========== GOVERNING VALUES ==========
+gov_M_case, gov_M_val = uls_results['governing']['M_max']
+gov_V_case, gov_V_val = uls_results['governing']['V_max']
+gov_sls_case = sls_results['governing']['case']
+
+Z_req = compute_required_section_modulus(gov_M_val, sigma_allow_Pa)
+Z_req_cm3 = Z_req * 1e6
+I_req = sls_results['governing']['I_req_m4']
+I_req_cm4 = sls_results['governing']['I_req_cm4']
+
+# Metric strings formatted once; the sections below only look them up
+display = {
+    'M_max': _fmt(uls_results['governing']['M_max_kNm'], "kN·m"),
+    'V_max': _fmt(uls_results['governing']['V_max_kN'], "kN"),
+    'Z_req': _fmt(Z_req_cm3, "cm³"),
+    'I_req': _fmt(I_req_cm4, "cm⁴"),
+    'v_limit': _fmt(sls_results['governing']['v_limit_mm'], "mm"),
+    'v_limit_ratio': f"L/{geom.span_mm/sls_results['governing']['v_limit_mm']:.0f}",
+}
+
 # ========================================
 # ULS ANALYSIS
 # ========================================
@@ -200,13 +401,10 @@ st.subheader("Ultimate Limit State (ULS)")
 # Governing values summary
 col1, col2, col3 = st.columns(3)
 
-gov_M_case, gov_M_val = uls_results['governing']['M_max']
-gov_V_case, gov_V_val = uls_results['governing']['V_max']
-
 with col1:
     st.metric(
         "Max Bending Moment",
-        f"{gov_M_val/1000:.2f} kN·m",
+        display['M_max'],
         help=f"Governing case: {gov_M_case}"
     )
     st.caption(f"📌 {gov_M_case}")
@@ -214,125 +412,45 @@ with col1:
 with col2:
     st.metric(
         "Max Shear Force",
-        f"{gov_V_val/1000:.2f} kN",
+        display['V_max'],
         help=f"Governing case: {gov_V_case}"
     )
     st.caption(f"📌 {gov_V_case}")
 
 with col3:
-    Z_req = compute_required_section_modulus(gov_M_val, sigma_allow_Pa)
     st.metric(
         "Required Section Modulus",
-        f"{Z_req*1e6:.2f} cm³",
+        display['Z_req'],
         help="Z_req = M_max / σ_allow"
     )
 
 # Reactions table
 st.markdown("#### Summary of All ULS Cases")
-reaction_data = []
-for case_name, case_data in uls_results['cases'].items():
-    reaction_data.append({
-        "Load Case": case_name,
-        "RA (kN)": f"{case_data['RA_N']/1000:.2f}",
-        "RB (kN)": f"{case_data['RB_N']/1000:.2f}",
-        "M_max (kN·m)": f"{case_data['M_max_Nm']/1000:.2f}",
-        "V_max (kN)": f"{case_data['V_max_N']/1000:.2f}"
-    })
-
-st.dataframe(reaction_data, width='stretch', hide_index=True)
+uls_cases = uls_results['cases']
+reaction_arr = np.array(
+    [[c['RA_kN'], c['RB_kN'], c['M_max_kNm'], c['V_max_kN']] for c in uls_cases.values()],
+    dtype=float
+).reshape(-1, 4)
+reaction_data = pd.DataFrame(reaction_arr, columns=["RA (kN)", "RB (kN)", "M_max (kN·m)", "V_max (kN)"])
+reaction_data.insert(0, "Load Case", list(uls_cases))
+
+st.dataframe(
+    reaction_data,
+    width='stretch',
+    hide_index=True,
+    column_config={
+        col: st.column_config.NumberColumn(format="%.2f")
+        for col in ("RA (kN)", "RB (kN)", "M_max (kN·m)", "V_max (kN)")
+    }
+)
 
 # Shear Force Diagram with dropdown
 st.markdown("#### Shear Force Diagram")
-
-# Case selector - default to governing
-case_options = list(uls_results['cases'].keys())
-default_V_idx = case_options.index(gov_V_case) if gov_V_case in case_options else 0
-
-selected_V_case = st.selectbox(
-    "Select ULS case for shear diagram:",
-    options=case_options,
-    index=default_V_idx,
-    key="uls_V_selector"
-)
-
-# Plot shear diagram
-V_data = uls_results['cases'][selected_V_case]
-fig_V = go.Figure()
-fig_V.add_trace(go.Scatter(
-    x=V_data['x_m'],
-    y=V_data['V_N']/1000,
-    mode='lines',
-    name='Shear Force',
-    line=dict(color='#e74c3c', width=2),
-    fill='tozeroy',
-    fillcolor='rgba(231, 76, 60, 0.2)'
-))
-
-fig_V.add_hline(y=0, line_dash="dash", line_color="gray", opacity=0.5)
-
-fig_V.update_layout(
-    title=f"Shear Force Diagram - {selected_V_case}",
-    xaxis_title="Position along span (m)",
-    yaxis_title="Shear Force (kN)",
-    height=400,
-    hovermode='x unified',
-    showlegend=False
-)
-
-st.plotly_chart(fig_V, width='stretch')
-
-# Show max value for selected case
-col1, col2 = st.columns(2)
-with col1:
-    st.metric("Max V (this case)", f"{V_data['V_max_N']/1000:.2f} kN")
-with col2:
-    st.metric("Location", f"{V_data['x_Vmax_m']:.3f} m")
+shear_diagram_block(uls_results, uls_key, gov_V_case)
 
 # Bending Moment Diagram with dropdown
 st.markdown("#### Bending Moment Diagram")
-
-# Case selector - default to governing
-default_M_idx = case_options.index(gov_M_case) if gov_M_case in case_options else 0
-
-selected_M_case = st.selectbox(
-    "Select ULS case for moment diagram:",
-    options=case_options,
-    index=default_M_idx,
-    key="uls_M_selector"
-)
-
-# Plot moment diagram
-M_data = uls_results['cases'][selected_M_case]
-fig_M = go.Figure()
-fig_M.add_trace(go.Scatter(
-    x=M_data['x_m'],
-    y=M_data['M_Nm']/1000,
-    mode='lines',
-    name='Bending Moment',
-    line=dict(color='#3498db', width=2),
-    fill='tozeroy',
-    fillcolor='rgba(52, 152, 219, 0.2)'
-))
-
-fig_M.add_hline(y=0, line_dash="dash", line_color="gray", opacity=0.5)
-
-fig_M.update_layout(
-    title=f"Bending Moment Diagram - {selected_M_case}",
-    xaxis_title="Position along span (m)",
-    yaxis_title="Bending Moment (kN·m)",
-    height=400,
-    hovermode='x unified',
-    showlegend=False
-)
-
-st.plotly_chart(fig_M, width='stretch')
-
-# Show max value for selected case
-col1, col2 = st.columns(2)
-with col1:
-    st.metric("Max M (this case)", f"{M_data['M_max_Nm']/1000:.2f} kN·m")
-with col2:
-    st.metric("Location", f"{M_data['x_Mmax_m']:.3f} m")
+moment_diagram_block(uls_results, uls_key, gov_M_case)
 
 st.markdown("---")
 
@@ -347,20 +465,18 @@ col1, col2, col3 = st.columns(3)
 with col1:
     st.metric(
         "Deflection Limit",
-        f"{sls_results['governing']['v_limit_mm']:.2f} mm",
-        help=f"L/{geom.span_mm/sls_results['governing']['v_limit_mm']:.0f}"
+        display['v_limit'],
+        help=display['v_limit_ratio']
     )
 
 with col2:
-    I_req = sls_results['governing']['I_req_m4']
     st.metric(
         "Required I",
-        f"{I_req*1e8:.2f} cm⁴",
+        display['I_req'],
         help="Second moment of area needed to satisfy deflection limit"
     )
 
 with col3:
-    gov_sls_case = sls_results['governing']['case']
     st.metric(
         "Governing Case",
         gov_sls_case,
@@ -369,16 +485,20 @@ with col3:
 
 # Detailed SLS results table
 st.markdown("#### All SLS Cases - Required I")
-sls_data = []
-for case_name, case_data in sls_results['cases'].items():
-    is_governing = "✓" if case_name == gov_sls_case else ""
-    sls_data.append({
-        "Load Case": case_name,
-        "Required I (cm⁴)": f"{case_data['I_req_m4']*1e8:.2f}",
-        "Governing": is_governing
-    })
-
-st.dataframe(sls_data, width='stretch', hide_index=True)
+sls_cases = sls_results['cases']
+sls_names = list(sls_cases)
+sls_data = pd.DataFrame({
+    "Load Case": sls_names,
+    "Required I (cm⁴)": np.fromiter((c['I_req_cm4'] for c in sls_cases.values()), dtype=float, count=len(sls_names)),
+    "Governing": ["✓" if name == gov_sls_case else "" for name in sls_names]
+})
+
+st.dataframe(
+    sls_data,
+    width='stretch',
+    hide_index=True,
+    column_config={"Required I (cm⁴)": st.column_config.NumberColumn(format="%.2f")}
+)
 
 st.markdown("---")
 
@@ -393,11 +513,11 @@ with st.container():
     col1, col2 = st.columns(2)
     with col1:
         st.markdown("### Strength (ULS)")
-        st.metric("Minimum Z required", f"{Z_req*1e6:.2f} cm³")
+        st.metric("Minimum Z required", display['Z_req'])
         st.caption(f"Based on {gov_M_case}")
     with col2:
         st.markdown("### Stiffness (SLS)")
-        st.metric("Minimum I required", f"{I_req*1e8:.2f} cm⁴")
+        st.metric("Minimum I required", display['I_req'])
         st.caption(f"Based on {gov_sls_case}")
 
 st.markdown("---")
@@ -409,35 +529,46 @@ section_selection_ui(
     container=st,
     geometry_info={'span_mm': geom.span_mm, 'bay_width_mm': geom.bay_width_mm},
     material=mat.material_type.value,  # "Aluminium" or "Steel"
-    Z_req_cm3=Z_req * 1e6,  # Convert m³ to cm³
-    I_req_cm4=I_req * 1e8,  # Convert m⁴ to cm⁴ (FIXED!)
+    Z_req_cm3=Z_req_cm3,
+    I_req_cm4=I_req_cm4,
     defl_limit_mm=sls_results['governing']['v_limit_mm'],
     uls_case_name=gov_M_case,
     sls_case_name=sls_results['governing'].get('case', ''),
     excel_path="data/mullion_profile_db.xlsx"
 )
 
-# Create the JSON data
-design_json = create_design_json(
-    geom=geom,
-    mat=mat,
-    loading_inputs=loading_inputs,
-    load_case_set=load_case_set,
-    deflection_limit_mm=deflection_limit_mm,
-    deflection_criteria=deflection_criteria,
-    safety_factor=safety_factor,
-    sigma_allow_Pa=sigma_allow_Pa,
-    uls_results=uls_results,
-    sls_results=sls_results,
-    Z_req=Z_req,
-    I_req=I_req
+# Every input the design JSON is built from - a cheap, hashable identity for
+# the design that the PDF export reuses instead of serializing the dict
+design_key = (
+    astuple(geom),
+    astuple(mat),
+    loading_inputs_key,
+    uls_cases_key,
+    sls_cases_key,
+    deflection_limit_mm,
+    deflection_criteria,
+    safety_factor,
+    sigma_allow_Pa,
+    Z_req,
+    I_req,
+)
+
+# Create the JSON data (cached - rebuilt only when an input changes)
+design_json = cached_design_json(
+    *design_key,
+    geom,
+    mat,
+    loading_inputs,
+    load_case_set,
+    uls_results,
+    sls_results
 )
 
 # Store it in session state (use design_json, not design_data!)
 st.session_state.design_data = design_json
 
 # Add download button to sidebar
-add_json_download_button(design_json)
+add_json_download_button(design_json, design_key=design_key)
 
 # In your sidebar section
 st.sidebar.header("Export Options")
@@ -454,7 +585,8 @@ project_name = st.sidebar.text_input(
 if hasattr(st.session_state, 'design_data'):
     add_pdf_download_button(
         design_data=st.session_state.design_data,
-        project_name=project_name if project_name else None
+        project_name=project_name if project_name else None,
+        design_key=design_key
     )
 else:
     st.sidebar.info("📊 Complete the design to download report")
@@ -1,7 +1,29 @@
 import json
+import pandas as pd
 import streamlit as st
 from datetime import datetime
-from typing import Dict, Any
+from typing import Dict, Any, Hashable, Optional
+
+# Optional faster serializer; serialize_design_json falls back to json without it
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Per-case fields exported for each ULS/SLS case, in output order
+_REACTION_FIELDS = ("RA_N", "RA_kN", "RB_N", "RB_kN", "M_max_Nm", "M_max_kNm", "V_max_N", "V_max_kN")
+_SLS_CASE_FIELDS = ("I_req_m4", "I_req_cm4")
+
+
+def _cases_to_dict(cases: Dict[str, Dict], fields: tuple) -> Dict[str, Dict[str, float]]:
+    """Select `fields` from every case and return {case_name: {field: value}} via one DataFrame."""
+    return pd.DataFrame(
+        [[case_data[f] for f in fields] for case_data in cases.values()],
+        index=list(cases),
+        columns=list(fields)
+    ).to_dict(orient='index')
+
 
 def create_design_json(
     geom,
@@ -15,7 +37,8 @@ def create_design_json(
     uls_results: Dict,
     sls_results: Dict,
     Z_req: float,
-    I_req: float
+    I_req: float,
+    include_timestamp: bool = True
 ) -> Dict[str, Any]:
     """
     Extract all key design variables into a JSON-serializable dictionary.
@@ -46,6 +69,10 @@ def create_design_json(
         Required section modulus in m³
     I_req : float
         Required moment of inertia in m⁴
+    include_timestamp : bool
+        Whether to set metadata.report_generated to the current time. Pass
+        False for cached designs and stamp each export with
+        stamp_report_generated() instead.
     
     Returns
     -------
@@ -60,10 +87,15 @@ def create_design_json(
     # Extract governing SLS values
     gov_sls_case = sls_results['governing']['case']
     
+    # Loading input fields, each read once
+    include_wind = getattr(loading_inputs, 'include_wind', False)
+    include_barrier = getattr(loading_inputs, 'include_barrier', False)
+    wind_pressure_kpa = getattr(loading_inputs, 'wind_pressure_kpa', 0)
+    barrier_load_kn_per_m = getattr(loading_inputs, 'barrier_load_kn_per_m', 0)
+    
     # Build the JSON structure
     design_data = {
         "metadata": {
-            "report_generated": datetime.now().isoformat(),
             "app_name": "TT Mullion Sizing App",
             "version": "1.0"
         },
@@ -87,13 +119,13 @@ def create_design_json(
         },
         
         "loading": {
-            "include_wind": loading_inputs.include_wind if hasattr(loading_inputs, 'include_wind') else False,
-            "wind_pressure_kPa": loading_inputs.wind_pressure_kpa if hasattr(loading_inputs, 'wind_pressure_kpa') else 0,
-            "wind_pressure_Pa": (loading_inputs.wind_pressure_kpa * 1000) if (hasattr(loading_inputs, 'wind_pressure_kpa') and loading_inputs.include_wind) else 0,
-            "include_barrier": loading_inputs.include_barrier if hasattr(loading_inputs, 'include_barrier') else False,
-            "barrier_load_kN_m": loading_inputs.barrier_load_kn_per_m if hasattr(loading_inputs, 'barrier_load_kn_per_m') else 0,
-            "barrier_load_N_m": (loading_inputs.barrier_load_kn_per_m * 1000) if (hasattr(loading_inputs, 'barrier_load_kn_per_m') and loading_inputs.include_barrier) else 0,
-            "barrier_height_mm": loading_inputs.barrier_height_mm if hasattr(loading_inputs, 'barrier_height_mm') else 1100,
+            "include_wind": include_wind,
+            "wind_pressure_kPa": wind_pressure_kpa,
+            "wind_pressure_Pa": wind_pressure_kpa * 1000 if include_wind else 0,
+            "include_barrier": include_barrier,
+            "barrier_load_kN_m": barrier_load_kn_per_m,
+            "barrier_load_N_m": barrier_load_kn_per_m * 1000 if include_barrier else 0,
+            "barrier_height_mm": getattr(loading_inputs, 'barrier_height_mm', 1100),
         },
         
         "load_cases": {
@@ -132,40 +164,22 @@ def create_design_json(
             "governing_moment": {
                 "case": gov_M_case,
                 "value_Nm": gov_M_val,
-                "value_kNm": gov_M_val / 1000
+                "value_kNm": uls_results['governing']['M_max_kNm']
             },
             "governing_shear": {
                 "case": gov_V_case,
                 "value_N": gov_V_val,
-                "value_kN": gov_V_val / 1000
+                "value_kN": uls_results['governing']['V_max_kN']
             },
-            "reactions": {
-                case_name: {
-                    "RA_N": case_data['RA_N'],
-                    "RA_kN": case_data['RA_N'] / 1000,
-                    "RB_N": case_data['RB_N'],
-                    "RB_kN": case_data['RB_N'] / 1000,
-                    "M_max_Nm": case_data['M_max_Nm'],
-                    "M_max_kNm": case_data['M_max_Nm'] / 1000,
-                    "V_max_N": case_data['V_max_N'],
-                    "V_max_kN": case_data['V_max_N'] / 1000
-                }
-                for case_name, case_data in uls_results['cases'].items()
-            }
+            "reactions": _cases_to_dict(uls_results['cases'], _REACTION_FIELDS)
         },
         
         "sls_results": {
             "deflection_limit_mm": sls_results['governing']['v_limit_mm'],
             "governing_case": gov_sls_case,
             "required_I_m4": I_req,
-            "required_I_cm4": I_req * 1e8,
-            "cases": {
-                case_name: {
-                    "I_req_m4": case_data['I_req_m4'],
-                    "I_req_cm4": case_data['I_req_m4'] * 1e8,
-                }
-                for case_name, case_data in sls_results['cases'].items()
-            }
+            "required_I_cm4": sls_results['governing']['I_req_cm4'],
+            "cases": _cases_to_dict(sls_results['cases'], _SLS_CASE_FIELDS)
         },
         
         "design_requirements": {
@@ -182,13 +196,49 @@ def create_design_json(
         }
     }
     
+    if include_timestamp:
+        design_data = stamp_report_generated(design_data)
     return design_data
 
 
+def stamp_report_generated(design_data: Dict[str, Any], when: Optional[datetime] = None) -> Dict[str, Any]:
+    """
+    Return a copy of design_data with metadata.report_generated set.
+    
+    Only the top level and the metadata dict are copied, so the input (which
+    may be a shared cached value) is left untouched.
+    
+    Parameters
+    ----------
+    design_data : Dict[str, Any]
+        The design data dictionary
+    when : Optional[datetime]
+        Generation time to record. Defaults to now.
+    """
+    when = when or datetime.now()
+    # Listed first, where create_design_json has always written it
+    metadata = {"report_generated": when.isoformat()}
+    metadata.update((k, v) for k, v in design_data["metadata"].items() if k != "report_generated")
+    return {**design_data, "metadata": metadata}
+
+
+def serialize_design_json(design_data: Dict[str, Any]) -> bytes:
+    """
+    Serialize design data to indented JSON bytes.
+    
+    Uses orjson (Rust-backed, handles numpy scalars natively) when installed,
+    otherwise falls back to the standard library json module.
+    """
+    if orjson is not None:
+        return orjson.dumps(design_data, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(design_data, indent=2).encode("utf-8")
+
+
 def add_json_download_button(
     design_data: Dict[str, Any],
     filename: str = "mullion_design.json",
-    button_label: str = "📥 Download Design JSON"
+    button_label: str = "📥 Download Design JSON",
+    design_key: Optional[Hashable] = None
 ):
     """
     Add a download button to the Streamlit sidebar for the design JSON.
@@ -201,37 +251,31 @@ def add_json_download_button(
         The filename for the downloaded JSON file
     button_label : str
         The label for the download button
+    design_key : Optional[Hashable]
+        Cheap, hashable identity of ``design_data`` (e.g. the inputs it was
+        built from). Defaults to its sorted JSON, which is serialized on
+        every rerun
     """
-    json_string = json.dumps(design_data, indent=2)
-    
-    st.sidebar.download_button(
-        label=button_label,
-        data=json_string,
-        file_name=filename,
-        mime="application/json",
-        help="Download design data as JSON for report generation"
-    )
-
-
-# Example usage in your main app:
-# After all analysis is complete, add this near the end of your script:
-"""
-# Create the JSON data
-design_json = create_design_json(
-    geom=geom,
-    mat=mat,
-    loading_inputs=loading_inputs,
-    load_case_set=load_case_set,
-    deflection_limit_mm=deflection_limit_mm,
-    deflection_criteria=deflection_criteria,
-    safety_factor=safety_factor,
-    sigma_allow_Pa=sigma_allow_Pa,
-    uls_results=uls_results,
-    sls_results=sls_results,
-    Z_req=Z_req,
-    I_req=I_req
-)
+    # Serialized here in the script (not in a deferred download callable) so
+    # a failure can be reported in the sidebar, as for the PDF. Each session
+    # keeps the bytes until the design changes, so ordinary reruns do not
+    # serialize anything; the generation time is when they were built
+    if design_key is None:
+        design_key = json.dumps(design_data, sort_keys=True, default=str)
+    try:
+        if st.session_state.get('json_export_key') != design_key:
+            st.session_state.json_export_bytes = serialize_design_json(stamp_report_generated(design_data))
+            st.session_state.json_export_key = design_key
 
-# Add download button to sidebar
-add_json_download_button(design_json)
-"""
+        st.sidebar.download_button(
+            label=button_label,
+            data=st.session_state.json_export_bytes,
+            file_name=filename,
+            mime="application/json",
+            help="Download design data as JSON for report generation"
+        )
+    except Exception as e:
+        st.sidebar.error(f"❌ JSON export failed: {str(e)}")
+        # Show detailed error in expander for debugging
+        with st.sidebar.expander("🔍 Error details"):
+            st.exception(e)
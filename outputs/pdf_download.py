@@ -1,22 +1,390 @@
 import io
 import json
 from datetime import datetime
-from typing import Dict, Any, Optional
+from functools import lru_cache
+from typing import Dict, Any, Hashable, Optional, Tuple
 import streamlit as st
+from outputs.json_download import stamp_report_generated
 
 from reportlab.lib import colors
 from reportlab.lib.pagesizes import A4
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import mm
-from reportlab.platypus import (
-    SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle,
-    PageBreak, KeepTogether, Image
-)
-from reportlab.lib.enums import TA_LEFT, TA_CENTER, TA_RIGHT
+from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, Image, Flowable
+from reportlab.platypus.tables import CellStyle
+from reportlab.lib.enums import TA_CENTER
 from reportlab.pdfbase import pdfmetrics
 from reportlab.pdfbase.ttfonts import TTFont
 import os
 
+
+# Footer logo - PNG is the most compatible format
+_LOGO_PATH = "images/TT_Logo_Colour.png"
+_LOGO_HEIGHT = 3 * mm  # 3 mm - as requested
+
+# Report colours, parsed once rather than on every style, table and page
+_HEADING_ORANGE = colors.HexColor('#db451d')
+_BORDER_BLUE = colors.HexColor('#1f4788')
+_TABLE_HEADER_BG = colors.HexColor('#e9e8e0')
+_TABLE_RULE = colors.HexColor('#8b9064')
+_ROW_ALT = colors.HexColor('#f5f4ed')
+_TT_DARK_BLUE = colors.HexColor('#00303C')
+_TT_LIGHT_BLUE = colors.HexColor('#CFF1F2')
+
+
+@lru_cache(maxsize=None)
+def _get_registered_fonts() -> Dict[str, str]:
+    """Register custom Raleway fonts once per process and return the font names to use."""
+    font_dir = "fonts"  # Directory where your font files are stored
+
+    # Define font paths - register the weights we'll use
+    fonts_to_register = [
+        ('Raleway-Regular', 'Raleway-Regular.ttf'),
+        ('Raleway-Medium', 'Raleway-Medium.ttf'),
+        ('Raleway-SemiBold', 'Raleway-SemiBold.ttf'),
+        ('Raleway-Bold', 'Raleway-Bold.ttf'),
+        ('Raleway-Italic', 'Raleway-Italic.ttf'),
+        ('Raleway-MediumItalic', 'Raleway-MediumItalic.ttf'),
+        ('Raleway-SemiBoldItalic', 'Raleway-SemiBoldItalic.ttf'),
+        ('Raleway-BoldItalic', 'Raleway-BoldItalic.ttf'),
+    ]
+
+    # List the font directory once rather than checking each file separately
+    try:
+        with os.scandir(font_dir) as entries:
+            present = {entry.name for entry in entries if entry.is_file()}
+    except FileNotFoundError:
+        present = set()
+
+    # Register each font if the file exists, skipping any already loaded by an
+    # earlier import of this module
+    registered = set(pdfmetrics.getRegisteredFontNames())
+    for font_name, font_file in fonts_to_register:
+        if font_name in registered:
+            continue
+        font_path = os.path.join(font_dir, font_file)
+        if font_file in present:
+            try:
+                pdfmetrics.registerFont(TTFont(font_name, font_path))
+                registered.add(font_name)
+            except Exception as e:
+                print(f"Warning: Could not register font {font_name}: {e}")
+        else:
+            print(f"Warning: Font file not found: {font_path}")
+
+    # Register the family so <b>/<i> markup in Raleway paragraphs resolves to
+    # the matching weight instead of falling back to Regular
+    if {'Raleway-Regular', 'Raleway-Bold', 'Raleway-Italic', 'Raleway-BoldItalic'} <= registered:
+        pdfmetrics.registerFontFamily(
+            'Raleway',
+            normal='Raleway-Regular',
+            bold='Raleway-Bold',
+            italic='Raleway-Italic',
+            boldItalic='Raleway-BoldItalic',
+        )
+
+    # Set font variables with fallback to Helvetica if Raleway not available
+    return {
+        'regular': 'Raleway-Regular' if 'Raleway-Regular' in registered else 'Helvetica',
+        'medium': 'Raleway-Medium' if 'Raleway-Medium' in registered else 'Helvetica-Bold',
+        'semibold': 'Raleway-SemiBold' if 'Raleway-SemiBold' in registered else 'Helvetica-Bold',
+        'bold': 'Raleway-Bold' if 'Raleway-Bold' in registered else 'Helvetica-Bold',
+        'italic': 'Raleway-Italic' if 'Raleway-Italic' in registered else 'Helvetica-Oblique',
+    }
+
+
+# Custom paragraph styles: (name, parent style, font weight key, other attributes)
+_STYLE_SPECS = (
+    # Bold for the main title
+    ('CustomTitle', 'Title', 'bold', dict(
+        fontSize=18,
+        textColor=colors.black,
+        spaceAfter=12,
+        alignment=TA_CENTER,
+    )),
+    # Bold for section headings
+    ('SectionHeading', 'Heading1', 'bold', dict(
+        fontSize=14,
+        textColor=_HEADING_ORANGE,
+        spaceAfter=8,
+        spaceBefore=12,
+        borderWidth=0,
+        borderColor=_BORDER_BLUE,
+        borderPadding=2,
+        borderRadius=0,
+    )),
+    # SemiBold for subsection headings
+    ('SubsectionHeading', 'Heading2', 'semibold', dict(
+        fontSize=11,
+        textColor=_HEADING_ORANGE,
+        spaceAfter=6,
+        spaceBefore=8,
+    )),
+    # Regular for body text
+    ('CustomBodyText', 'Normal', 'regular', dict(
+        fontSize=10,
+        spaceAfter=6,
+    )),
+    # Regular for the footer
+    ('FooterText', 'Normal', 'regular', dict(
+        fontSize=8,
+        textColor=colors.grey,
+        alignment=TA_CENTER,
+    )),
+)
+
+
+def _setup_custom_styles(fonts: Dict[str, str]):
+    """Create the sample stylesheet plus the custom paragraph styles for the report."""
+    styles = getSampleStyleSheet()
+
+    for name, parent, font, attrs in _STYLE_SPECS:
+        if name not in styles:
+            styles.add(ParagraphStyle(
+                name=name,
+                parent=styles[parent],
+                fontName=fonts[font],
+                **attrs
+            ))
+
+    return styles
+
+
+@lru_cache(maxsize=4)
+def _logo_draw_size(logo_path: str, mtime: float) -> Optional[Tuple[float, float]]:
+    """
+    Read the logo once per file version and return its footer draw size.
+
+    ``mtime`` is only part of the cache key, so an updated image is re-read.
+    """
+    try:
+        logo = Image(logo_path)
+        # Maintain aspect ratio at the footer logo height
+        return logo.imageWidth * (_LOGO_HEIGHT / logo.imageHeight), _LOGO_HEIGHT
+    except Exception as e:
+        print(f"Warning: Could not add logo from {logo_path}: {e}")
+        return None
+
+
+# Fonts are registered and styles built once at import, then shared by every
+# report instead of being recreated for each one
+_FONTS = _get_registered_fonts()
+_STYLES = _setup_custom_styles(_FONTS)
+
+# Shared table styling - parsed into a TableStyle once and reused by every table
+_DEFAULT_TABLE_STYLE_CMDS = (
+    ('BACKGROUND', (0, 0), (-1, 0), _TABLE_HEADER_BG),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.black),
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('FONTNAME', (0, 0), (-1, 0), _FONTS['bold']),
+    ('FONTSIZE', (0, 0), (-1, 0), 10),
+    ('FONTNAME', (0, 1), (-1, -1), _FONTS['regular']),
+    ('FONTSIZE', (0, 1), (-1, -1), 9),
+    ('BOTTOMPADDING', (0, 0), (-1, 0), 8),
+    ('TOPPADDING', (0, 0), (-1, 0), 8),
+    ('BOTTOMPADDING', (0, 1), (-1, -1), 6),
+    ('TOPPADDING', (0, 1), (-1, -1), 6),
+    ('LINEABOVE', (0, 0), (-1, 0), 1.0, _TABLE_RULE),
+    ('LINEBELOW', (0, 0), (-1, 0), 0.7, _TABLE_RULE),
+    ('LINEBELOW', (0, -1), (-1, -1), 1.0, _TABLE_RULE),
+    ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, _ROW_ALT]),
+)
+_DEFAULT_TABLE_STYLE = TableStyle(_DEFAULT_TABLE_STYLE_CMDS)
+
+# Design requirements summary table: custom styling with both rows light blue
+_REQUIREMENTS_TABLE_STYLE = TableStyle([
+    # Header styling
+    ('BACKGROUND', (0, 0), (-1, 0), _TT_DARK_BLUE),  # TT Dark Blue header
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+
+    # Both data rows light blue
+    ('BACKGROUND', (0, 1), (-1, 2), _TT_LIGHT_BLUE),  # Both rows: Light Blue
+
+    # Alignment and fonts
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('FONTNAME', (0, 0), (-1, 0), _FONTS['bold']),
+    ('FONTSIZE', (0, 0), (-1, 0), 10),
+    ('FONTNAME', (0, 1), (-1, -1), _FONTS['regular']),
+    ('FONTSIZE', (0, 1), (-1, -1), 9),
+
+    # Padding
+    ('BOTTOMPADDING', (0, 0), (-1, 0), 8),
+    ('TOPPADDING', (0, 0), (-1, 0), 8),
+    ('BOTTOMPADDING', (0, 1), (-1, -1), 6),
+    ('TOPPADDING', (0, 1), (-1, -1), 6),
+
+    # Lines
+    ('LINEABOVE', (0, 0), (-1, 0), 1.0, _TT_DARK_BLUE),
+    ('LINEBELOW', (0, 0), (-1, 0), 0.7, _TT_DARK_BLUE),
+    ('LINEBELOW', (0, -1), (-1, -1), 1.0, _TT_DARK_BLUE),
+    # Apply bold font to 2nd last column (Net pressure column) data rows only
+    ('FONTNAME', (-2, 1), (-2, -1), _FONTS['bold']),
+])
+
+# Paragraph styles used by every report, resolved from the stylesheet once.
+# The Paragraphs themselves are built per report, since Platypus stores
+# layout state (canvas, frame, postponed flags) on placed flowables
+_STYLE_SECTION = _STYLES['SectionHeading']
+_STYLE_SUBSECTION = _STYLES['SubsectionHeading']
+_STYLE_BODY = _STYLES['CustomBodyText']
+
+# Page margins and the table column layouts, which all span the content width
+_PAGE_MARGIN = 30
+_CONTENT_WIDTH = A4[0] - _PAGE_MARGIN - _PAGE_MARGIN
+_COLS_PARAM = (_CONTENT_WIDTH * 0.6, _CONTENT_WIDTH * 0.25, _CONTENT_WIDTH * 0.15)
+_COLS_CASES = (_CONTENT_WIDTH * 0.4, _CONTENT_WIDTH * 0.3, _CONTENT_WIDTH * 0.3)
+_COLS_GOV = (_CONTENT_WIDTH * 0.3, _CONTENT_WIDTH * 0.3, _CONTENT_WIDTH * 0.2, _CONTENT_WIDTH * 0.2)
+_COLS_ULS = (_CONTENT_WIDTH * 0.25, _CONTENT_WIDTH * 0.175, _CONTENT_WIDTH * 0.175,
+             _CONTENT_WIDTH * 0.2, _CONTENT_WIDTH * 0.2)
+_COLS_SLS = (_CONTENT_WIDTH * 0.6, _CONTENT_WIDTH * 0.4)
+_COLS_REQ = (_CONTENT_WIDTH * 0.3, _CONTENT_WIDTH * 0.3, _CONTENT_WIDTH * 0.225, _CONTENT_WIDTH * 0.175)
+
+# Bound format methods for table values, avoiding per-call format-spec parsing
+_F0 = "{:.0f}".format
+_F1 = "{:.1f}".format
+_F2 = "{:.2f}".format
+_F3 = "{:.3f}".format
+
+
+# Row ranges _CaseTableFlowable draws, each spanning every column:
+# 0 is the header, 1 the body rows and -1 the last row
+_CASE_TABLE_ROWS = {((0, 0), (-1, 0)): 0, ((0, 1), (-1, -1)): 1, ((0, -1), (-1, -1)): -1}
+# The (op, row) style commands _CaseTableFlowable draws
+_CASE_TABLE_OPS = frozenset({
+    ('FONTNAME', 0), ('FONTSIZE', 0), ('TOPPADDING', 0), ('BOTTOMPADDING', 0),
+    ('TEXTCOLOR', 0), ('BACKGROUND', 0), ('LINEABOVE', 0), ('LINEBELOW', 0),
+    ('FONTNAME', 1), ('FONTSIZE', 1), ('TOPPADDING', 1), ('BOTTOMPADDING', 1),
+    ('TEXTCOLOR', 1), ('ROWBACKGROUNDS', 1), ('LINEBELOW', -1),
+})
+
+
+def _case_table_style() -> Dict[Tuple[str, int], tuple]:
+    """
+    ``_DEFAULT_TABLE_STYLE_CMDS`` as {(op, row): values} for _CaseTableFlowable.
+
+    Raises ValueError for any command the flowable would not draw exactly as
+    Table does (another row or column range, an op it does not draw, or a
+    second command for the same op and rows), so the two cannot diverge.
+    """
+    style = {}
+    for cmd in _DEFAULT_TABLE_STYLE_CMDS:
+        op, cells, values = cmd[0], cmd[1:3], cmd[3:]
+        if op == 'ALIGN' and cells == ((0, 0), (-1, -1)) and values == ('LEFT',):
+            continue  # Cell text is always drawn left-aligned
+        key = (op, _CASE_TABLE_ROWS.get(cells))
+        if key not in _CASE_TABLE_OPS or key in style:
+            raise ValueError(f"_CaseTableFlowable cannot draw table style command {cmd!r}")
+        style[key] = values
+    return style
+
+
+_CASE_TABLE_STYLE = _case_table_style()
+
+
+def _table_row_metrics(row):
+    """Font, font size, row height and text baseline of a single-line case table row."""
+    font, = _CASE_TABLE_STYLE.get(('FONTNAME', row), (CellStyle.fontname,))
+    size, = _CASE_TABLE_STYLE.get(('FONTSIZE', row), (CellStyle.fontsize,))
+    top, = _CASE_TABLE_STYLE.get(('TOPPADDING', row), (CellStyle.topPadding,))
+    bottom, = _CASE_TABLE_STYLE.get(('BOTTOMPADDING', row), (CellStyle.bottomPadding,))
+    # Table bottom-aligns cell text: baseline = bottom padding + leading - font size
+    return font, size, top + CellStyle.leading + bottom, bottom + CellStyle.leading - size
+
+
+class _CaseTableFlowable(Flowable):
+    """
+    Plain-text case table drawn straight onto the canvas.
+
+    Used for the long "All Load Cases" tables, whose cells are all
+    single-line strings. Draws ``_DEFAULT_TABLE_STYLE`` (fonts, padding,
+    colours and rules are all read from its commands, see
+    _case_table_style) without Table's per-cell measuring and style
+    resolution. Like ``Table(repeatRows=1)`` it splits between rows and
+    repeats the header.
+    """
+
+    HEADER_FONT, HEADER_FONT_SIZE, HEADER_HEIGHT, HEADER_BASELINE = _table_row_metrics(0)
+    ROW_FONT, ROW_FONT_SIZE, ROW_HEIGHT, ROW_BASELINE = _table_row_metrics(1)
+    LEFT_PADDING = CellStyle.leftPadding
+    HEADER_TEXT_COLOR, = _CASE_TABLE_STYLE.get(('TEXTCOLOR', 0), (CellStyle.color,))
+    ROW_TEXT_COLOR, = _CASE_TABLE_STYLE.get(('TEXTCOLOR', 1), (CellStyle.color,))
+    HEADER_BACKGROUND, = _CASE_TABLE_STYLE[('BACKGROUND', 0)]
+    ROW_BACKGROUNDS, = _CASE_TABLE_STYLE[('ROWBACKGROUNDS', 1)]
+    RULE_ABOVE_HEADER = _CASE_TABLE_STYLE[('LINEABOVE', 0)]
+    RULE_BELOW_HEADER = _CASE_TABLE_STYLE[('LINEBELOW', 0)]
+    RULE_BELOW_LAST = _CASE_TABLE_STYLE[('LINEBELOW', -1)]
+
+    def __init__(self, rows, col_widths, last_part=True):
+        Flowable.__init__(self)
+        self.hAlign = 'CENTER'  # Match Table's default alignment in the frame
+        self.header = rows[0]
+        self.rows = rows[1:]
+        self.col_widths = col_widths
+        self.last_part = last_part  # Only the final fragment gets the closing rule
+        self.width = sum(col_widths)
+        self.height = self.HEADER_HEIGHT + len(self.rows) * self.ROW_HEIGHT
+
+    def wrap(self, availWidth, availHeight):
+        return self.width, self.height
+
+    def split(self, availWidth, availHeight):
+        n = int((availHeight - self.HEADER_HEIGHT) // self.ROW_HEIGHT)
+        if n < 1 or n >= len(self.rows):
+            return []
+        return [
+            _CaseTableFlowable((self.header,) + self.rows[:n], self.col_widths, last_part=False),
+            _CaseTableFlowable((self.header,) + self.rows[n:], self.col_widths, self.last_part),
+        ]
+
+    def _rule(self, y, rule):
+        weight, color = rule
+        self.canv.setLineWidth(weight)
+        self.canv.setStrokeColor(color)
+        self.canv.line(0, y, self.width, y)
+
+    def draw(self):
+        canv = self.canv
+        width = self.width
+        header_y = self.height - self.HEADER_HEIGHT
+        text_x = [self.LEFT_PADDING]
+        for col_width in self.col_widths[:-1]:
+            text_x.append(text_x[-1] + col_width)
+
+        # Header and alternating row backgrounds
+        canv.setFillColor(self.HEADER_BACKGROUND)
+        canv.rect(0, header_y, width, self.HEADER_HEIGHT, stroke=0, fill=1)
+        row_colors = self.ROW_BACKGROUNDS
+        y = header_y
+        for i in range(len(self.rows)):
+            y -= self.ROW_HEIGHT
+            canv.setFillColor(row_colors[i % len(row_colors)])
+            canv.rect(0, y, width, self.ROW_HEIGHT, stroke=0, fill=1)
+
+        # Cell text, all in one text object
+        text = canv.beginText()
+        text.setFillColor(self.HEADER_TEXT_COLOR)
+        text.setFont(self.HEADER_FONT, self.HEADER_FONT_SIZE)
+        for x, value in zip(text_x, self.header):
+            text.setTextOrigin(x, header_y + self.HEADER_BASELINE)
+            text.textOut(value)
+        text.setFillColor(self.ROW_TEXT_COLOR)
+        text.setFont(self.ROW_FONT, self.ROW_FONT_SIZE)
+        y = header_y
+        for row in self.rows:
+            y -= self.ROW_HEIGHT
+            for x, value in zip(text_x, row):
+                text.setTextOrigin(x, y + self.ROW_BASELINE)
+                text.textOut(value)
+        canv.drawText(text)
+
+        # Rules above and below the header, and below the final row
+        canv.setLineCap(1)
+        self._rule(self.height, self.RULE_ABOVE_HEADER)
+        if self.last_part:
+            self._rule(0, self.RULE_BELOW_LAST)
+        self._rule(header_y, self.RULE_BELOW_HEADER)
+
+
 class MullionDesignReport:
     """Generate a professional PDF report for mullion design calculations."""
 
@@ -38,470 +406,303 @@ class MullionDesignReport:
         self.page_width = A4[0]
         self.page_height = A4[1]
         # Define margins to match document
-        self.left_margin = 30
-        self.right_margin = 30
-        self.content_width = self.page_width - self.left_margin - self.right_margin
-        self.styles = getSampleStyleSheet()
-        self._register_fonts()
-        self._setup_custom_styles()
-
-    def _register_fonts(self):
-        """Register custom Raleway fonts."""
-        font_dir = "fonts"  # Directory where your font files are stored
-
-        # Define font paths - register the weights we'll use
-        fonts_to_register = [
-            ('Raleway-Regular', 'Raleway-Regular.ttf'),
-            ('Raleway-Medium', 'Raleway-Medium.ttf'),
-            ('Raleway-SemiBold', 'Raleway-SemiBold.ttf'),
-            ('Raleway-Bold', 'Raleway-Bold.ttf'),
-            ('Raleway-Italic', 'Raleway-Italic.ttf'),
-            ('Raleway-MediumItalic', 'Raleway-MediumItalic.ttf'),
-            ('Raleway-SemiBoldItalic', 'Raleway-SemiBoldItalic.ttf'),
-            ('Raleway-BoldItalic', 'Raleway-BoldItalic.ttf'),
-        ]
-
-        # Register each font if the file exists
-        for font_name, font_file in fonts_to_register:
-            font_path = os.path.join(font_dir, font_file)
-            if os.path.exists(font_path):
-                try:
-                    pdfmetrics.registerFont(TTFont(font_name, font_path))
-                except Exception as e:
-                    print(f"Warning: Could not register font {font_name}: {e}")
-            else:
-                print(f"Warning: Font file not found: {font_path}")
-
-        # Set font variables with fallback to Helvetica if Raleway not available
-        self.font_regular = 'Raleway-Regular' if os.path.exists(os.path.join(font_dir, 'Raleway-Regular.ttf')) else 'Helvetica'
-        self.font_medium = 'Raleway-Medium' if os.path.exists(os.path.join(font_dir, 'Raleway-Medium.ttf')) else 'Helvetica-Bold'
-        self.font_semibold = 'Raleway-SemiBold' if os.path.exists(os.path.join(font_dir, 'Raleway-SemiBold.ttf')) else 'Helvetica-Bold'
-        self.font_bold = 'Raleway-Bold' if os.path.exists(os.path.join(font_dir, 'Raleway-Bold.ttf')) else 'Helvetica-Bold'
-        self.font_italic = 'Raleway-Italic' if os.path.exists(os.path.join(font_dir, 'Raleway-Italic.ttf')) else 'Helvetica-Oblique'
-
-    def _setup_custom_styles(self):
-        """Create custom paragraph styles for the report."""
-        # Only add styles if they don't already exist
-        if 'CustomTitle' not in self.styles:
-            self.styles.add(ParagraphStyle(
-                name='CustomTitle',
-                parent=self.styles['Title'],
-                fontSize=18,
-                textColor=colors.black,
-                spaceAfter=12,
-                alignment=TA_CENTER,
-                fontName=self.font_bold  # Use Bold for main title
-            ))
-
-        if 'SectionHeading' not in self.styles:
-            self.styles.add(ParagraphStyle(
-                name='SectionHeading',
-                parent=self.styles['Heading1'],
-                fontSize=14,
-                textColor=colors.HexColor('#db451d'),
-                spaceAfter=8,
-                spaceBefore=12,
-                fontName=self.font_bold,  # Use Bold for section headings
-                borderWidth=0,
-                borderColor=colors.HexColor('#1f4788'),
-                borderPadding=2,
-                borderRadius=0,
-            ))
-
-        if 'SubsectionHeading' not in self.styles:
-            self.styles.add(ParagraphStyle(
-                name='SubsectionHeading',
-                parent=self.styles['Heading2'],
-                fontSize=11,
-                textColor=colors.HexColor('#db451d'),
-                spaceAfter=6,
-                spaceBefore=8,
-                fontName=self.font_semibold  # Use SemiBold for subsection headings
-            ))
-
-        if 'CustomBodyText' not in self.styles:
-            self.styles.add(ParagraphStyle(
-                name='CustomBodyText',
-                parent=self.styles['Normal'],
-                fontSize=10,
-                spaceAfter=6,
-                fontName=self.font_regular  # Use Regular for body text
-            ))
-        
-        if 'FooterText' not in self.styles:
-            self.styles.add(ParagraphStyle(
-                name='FooterText',
-                parent=self.styles['Normal'],
-                fontSize=8,
-                textColor=colors.grey,
-                alignment=TA_CENTER,
-                fontName=self.font_regular  # Use Regular for footer
-            ))
+        self.left_margin = _PAGE_MARGIN
+        self.right_margin = _PAGE_MARGIN
+        # Same width the module-level _COLS_* table layouts are computed from
+        self.content_width = _CONTENT_WIDTH
+        # Fonts and paragraph styles are shared by every report (see module level)
+        self.font_regular = _FONTS['regular']
+        self.font_medium = _FONTS['medium']
+        self.font_semibold = _FONTS['semibold']
+        self.font_bold = _FONTS['bold']
+        self.font_italic = _FONTS['italic']
+        self.styles = _STYLES
+        self._style_body = _STYLE_BODY
+        meta = design_data['metadata']
+        # Title-page metadata, formatted once from the design data. A design
+        # without a generation time (e.g. the shared cached one) is dated now
+        generated = meta.get('report_generated')
+        report_date = datetime.fromisoformat(generated) if generated else datetime.now()
+        self._report_date_str = report_date.strftime('%B %d, %Y at %H:%M')
+        self._app_label = f"{meta['app_name']} v{meta['version']}"
+        # Header/footer text and positions are the same on every page, so
+        # work them out once here rather than per page
+        if project_name:
+            self._header_text = f"{project_name}: Mullion Design Calculation Report"
+        else:
+            self._header_text = "Mullion Design Calculation Report"
+        self._header_date_str = datetime.now().strftime("%B %d, %Y")
+        self._version_str = f"Version {meta['version']}"
+        self._header_line_y = self.page_height - 40
+        self._header_text_y = self.page_height - 32
+        self._right_x = self.page_width - self.right_margin
+        self._centre_x = self.page_width / 2
+        self._logo_size = self._load_logo()
+
+    def _load_logo(self):
+        """Return the footer logo's draw size, or None if it is unavailable."""
+        try:
+            mtime = os.path.getmtime(_LOGO_PATH)
+        except OSError:
+            return None
+        return _logo_draw_size(_LOGO_PATH, mtime)
 
     def _header_footer(self, canvas, doc):
         """Add header and footer to each page."""
         canvas.saveState()
 
-        # Header
+        # Header and footer share one line and colour state, so set it once
         canvas.setStrokeColor(colors.grey)
         canvas.setLineWidth(1)
-        canvas.line(self.left_margin, self.page_height - 40, 
-                   self.page_width - self.right_margin, self.page_height - 40)
-
-        canvas.setFont(self.font_semibold, 8)  # Use SemiBold for header
-        canvas.setFillColor(colors.grey)
-        
-        # Header text with optional project name
-        if self.project_name:
-            header_text = f"{self.project_name}: Mullion Design Calculation Report"
-        else:
-            header_text = "Mullion Design Calculation Report"
-        canvas.drawString(self.left_margin, self.page_height - 32, header_text)
-
-        canvas.setFont(self.font_regular, 8)
         canvas.setFillColor(colors.grey)
-        date_str = datetime.now().strftime("%B %d, %Y")
-        canvas.drawRightString(self.page_width - self.right_margin, self.page_height - 32, date_str)
+        canvas.line(self.left_margin, self._header_line_y, self._right_x, self._header_line_y)
+        canvas.line(self.left_margin, 40, self._right_x, 40)
 
-        # Footer
-        canvas.setStrokeColor(colors.grey)
-        canvas.setLineWidth(1)
-        canvas.line(self.left_margin, 40, self.page_width - self.right_margin, 40)
+        # Header text with optional project name
+        canvas.setFont(self.font_semibold, 8)  # Use SemiBold for header
+        canvas.drawString(self.left_margin, self._header_text_y, self._header_text)
 
+        # Everything else on the page is set in Regular
         canvas.setFont(self.font_regular, 8)
-        canvas.setFillColor(colors.grey)
+        canvas.drawRightString(self._right_x, self._header_text_y, self._header_date_str)
 
-        # Try to add logo - prefer PNG/JPG over SVG
-
-        logo_added = False
-        
-        # Try PNG first (most compatible)
-        for logo_path in ["images/TT_Logo_Colour.png"]:
-            if os.path.exists(logo_path):
-                try:
-                    from reportlab.platypus import Image as RLImage
-                    # Add logo with appropriate sizing
-                    logo_height = 3  # mm - as requested
-                    logo = RLImage(logo_path, height=logo_height*mm)
-                    # Maintain aspect ratio
-                    logo.drawHeight = logo_height * mm
-                    logo.drawWidth = logo.imageWidth * (logo_height * mm / logo.imageHeight)
-                    logo.drawOn(canvas, self.left_margin, 20)
-                    logo_added = True
-                    break
-                except Exception as e:
-                    print(f"Warning: Could not add logo from {logo_path}: {e}")
-
-        # Fallback to text if no logo found
-        if not logo_added:
+        # Footer logo, falling back to text if it could not be loaded
+        if self._logo_size is not None:
+            canvas.drawImage(_LOGO_PATH, self.left_margin, 20, *self._logo_size, mask="auto")
+        else:
             canvas.drawString(self.left_margin, 30, "Thornton Tomasetti")
 
-        canvas.drawCentredString(self.page_width / 2, 30, f"Page {doc.page}")
-        canvas.drawRightString(self.page_width - self.right_margin, 30, 
-                              f"Version {self.data['metadata']['version']}")
+        canvas.drawCentredString(self._centre_x, 30, f"Page {doc.page}")
+        canvas.drawRightString(self._right_x, 30, self._version_str)
 
         canvas.restoreState()
 
-    def _create_table(self, data, col_widths=None, style_commands=None):
+    def _create_table(self, data, col_widths=None, style_commands=None, splittable=True):
         """Create a formatted table with consistent styling."""
-        default_style = [
-            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#e9e8e0')),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.black),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('FONTNAME', (0, 0), (-1, 0), self.font_bold),
-            ('FONTSIZE', (0, 0), (-1, 0), 10),
-            ('FONTNAME', (0, 1), (-1, -1), self.font_regular),
-            ('FONTSIZE', (0, 1), (-1, -1), 9),
-            ('BOTTOMPADDING', (0, 0), (-1, 0), 8),
-            ('TOPPADDING', (0, 0), (-1, 0), 8),
-            ('BOTTOMPADDING', (0, 1), (-1, -1), 6),
-            ('TOPPADDING', (0, 1), (-1, -1), 6),
-            ('LINEABOVE', (0, 0), (-1, 0), 1.0, colors.HexColor('#8b9064')),
-            ('LINEBELOW', (0, 0), (-1, 0), 0.7, colors.HexColor('#8b9064')),
-            ('LINEBELOW', (0, -1), (-1, -1), 1.0, colors.HexColor('#8b9064')),
-            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f5f4ed')])
-        ]
-
+        # Repeat the header row on every page a long table splits onto
+        table = Table(data, colWidths=col_widths, repeatRows=1)
+        if not splittable:
+            # Short fixed-size tables move to the next page whole rather
+            # than being tried for a row split
+            table.splitByRow = 0
         if style_commands:
-            default_style.extend(style_commands)
-
-        table = Table(data, colWidths=col_widths)
-        table.setStyle(TableStyle(default_style))
+            table.setStyle(TableStyle(style_commands, parent=_DEFAULT_TABLE_STYLE))
+        else:
+            table.setStyle(_DEFAULT_TABLE_STYLE)
         return table
 
-    def _add_geometry_section(self, story):
-        """Add geometry section to the report."""
-        story.append(Paragraph("1. Geometry", self.styles['SectionHeading']))
-
+    def _build_geometry_section(self):
+        """Build the geometry section flowables for the report."""
         geom = self.data['geometry']
-        data = [
-            ['Parameter', 'Value', 'Units'],
-            ['Span', f"{geom['span_mm']:.0f}", 'mm'],
-            ['Bay Width', f"{geom['bay_width_mm']:.0f}", 'mm'],
-            ['Tributary Area', f"{geom['tributary_area_m2']:.3f}", 'm²']
-        ]
-
-        # Use content width for table
-        col_widths = [self.content_width * 0.6, self.content_width * 0.25, self.content_width * 0.15]
-        table = self._create_table(data, col_widths=col_widths)
-        story.append(table)
-        story.append(Spacer(1, 12))
+        data = (
+            ('Parameter', 'Value', 'Units'),
+            ('Span', _F0(geom['span_mm']), 'mm'),
+            ('Bay Width', _F0(geom['bay_width_mm']), 'mm'),
+            ('Tributary Area', _F3(geom['tributary_area_m2']), 'm²')
+        )
 
-    def _add_material_section(self, story):
-        """Add material properties section to the report."""
-        story.append(Paragraph("2. Material Properties", self.styles['SectionHeading']))
+        return [
+            Paragraph("1. Geometry", _STYLE_SECTION),
+            self._create_table(data, col_widths=_COLS_PARAM, splittable=False),
+            Spacer(1, 12),
+        ]
 
+    def _build_material_section(self):
+        """Build the material properties section flowables for the report."""
         mat = self.data['material']
-        data = [
-            ['Property', 'Value', 'Units'],
-            ['Material Type', mat['type'], ''],
-            ['Grade', mat['grade'], ''],
-            ['Elastic Modulus (E)', f"{mat['elastic_modulus_GPa']:.1f}", 'GPa'],
-            ['Yield Strength (fy)', f"{mat['yield_strength_MPa']:.1f}", 'MPa'],
-            ['Density', f"{mat['density_kg_m3']:.0f}", 'kg/m³']
-        ]
+        data = (
+            ('Property', 'Value', 'Units'),
+            ('Material Type', mat['type'], ''),
+            ('Grade', mat['grade'], ''),
+            ('Elastic Modulus (E)', _F1(mat['elastic_modulus_GPa']), 'GPa'),
+            ('Yield Strength (fy)', _F1(mat['yield_strength_MPa']), 'MPa'),
+            ('Density', _F0(mat['density_kg_m3']), 'kg/m³')
+        )
 
-        col_widths = [self.content_width * 0.6, self.content_width * 0.25, self.content_width * 0.15]
-        table = self._create_table(data, col_widths=col_widths)
-        story.append(table)
-        story.append(Spacer(1, 12))
+        return [
+            Paragraph("2. Material Properties", _STYLE_SECTION),
+            self._create_table(data, col_widths=_COLS_PARAM, splittable=False),
+            Spacer(1, 12),
+        ]
 
-    def _add_loading_section(self, story):
-        """Add loading conditions section to the report."""
-        story.append(Paragraph("3. Loading Conditions", self.styles['SectionHeading']))
-        
+    def _build_loading_section(self):
+        """Build the loading conditions section flowables for the report."""
         loading = self.data['loading']
         
-        story.append(Paragraph("3.1 Wind Loading", self.styles['SubsectionHeading']))
-        wind_data = [
-            ['Parameter', 'Value', 'Units'],
-            ['Include Wind Load', 'Yes' if loading['include_wind'] else 'No', ''],
-        ]
+        wind_data = (
+            ('Parameter', 'Value', 'Units'),
+            ('Include Wind Load', 'Yes' if loading['include_wind'] else 'No', ''),
+        )
         if loading['include_wind']:
-            wind_data.extend([
-                ['Wind Pressure', f"{loading['wind_pressure_kPa']:.2f}", 'kPa'],
-            ])
-
-        col_widths = [self.content_width * 0.6, self.content_width * 0.25, self.content_width * 0.15]
-        table = self._create_table(wind_data, col_widths=col_widths)
-        story.append(table)
-        story.append(Spacer(1, 8))
-        
-        story.append(Paragraph("3.2 Barrier Loading", self.styles['SubsectionHeading']))
-        barrier_data = [
-            ['Parameter', 'Value', 'Units'],
-            ['Include Barrier Load', 'Yes' if loading['include_barrier'] else 'No', ''],
-        ]
+            wind_data += (
+                ('Wind Pressure', _F2(loading['wind_pressure_kPa']), 'kPa'),
+            )
+
+        barrier_data = (
+            ('Parameter', 'Value', 'Units'),
+            ('Include Barrier Load', 'Yes' if loading['include_barrier'] else 'No', ''),
+        )
         if loading['include_barrier']:
-            barrier_data.extend([
-                ['Barrier Load', f"{loading['barrier_load_kN_m']:.2f}", 'kN/m'],
-                ['Barrier Height', f"{loading['barrier_height_mm']:.0f}", 'mm']
-            ])
-
-        table = self._create_table(barrier_data, col_widths=col_widths)
-        story.append(table)
-        story.append(Spacer(1, 12))
+            barrier_data += (
+                ('Barrier Load', _F2(loading['barrier_load_kN_m']), 'kN/m'),
+                ('Barrier Height', _F0(loading['barrier_height_mm']), 'mm')
+            )
+
+        return [
+            Paragraph("3. Loading Conditions", _STYLE_SECTION),
+            Paragraph("3.1 Wind Loading", _STYLE_SUBSECTION),
+            self._create_table(wind_data, col_widths=_COLS_PARAM, splittable=False),
+            Spacer(1, 8),
+            Paragraph("3.2 Barrier Loading", _STYLE_SUBSECTION),
+            self._create_table(barrier_data, col_widths=_COLS_PARAM, splittable=False),
+            Spacer(1, 12),
+        ]
     
-    def _add_load_cases_section(self, story):
-        """Add load cases section to the report."""
-        story.append(Paragraph("4. Load Cases", self.styles['SectionHeading']))
-        
+    def _build_load_cases_section(self):
+        """Build the load cases section flowables for the report."""
         cases = self.data['load_cases']
         
-        story.append(Paragraph("4.1 Ultimate Limit State (ULS)", self.styles['SubsectionHeading']))
-        uls_data = [['Case Name', 'Wind Factor', 'Barrier Factor']]
-        for case in cases['uls_cases']:
-            uls_data.append([
-                case['name'],
-                f"{case['wind_factor']:.2f}",
-                f"{case['barrier_factor']:.2f}"
-            ])
-        
-        col_widths = [self.content_width * 0.4, self.content_width * 0.3, self.content_width * 0.3]
-        table = self._create_table(uls_data, col_widths=col_widths)
-        story.append(table)
-        story.append(Spacer(1, 8))
+        uls_data = (('Case Name', 'Wind Factor', 'Barrier Factor'),)
+        uls_data += tuple(
+            (case['name'], _F2(case['wind_factor']), _F2(case['barrier_factor']))
+            for case in cases['uls_cases']
+        )
         
-        story.append(Paragraph("4.2 Serviceability Limit State (SLS)", self.styles['SubsectionHeading']))
-        sls_data = [['Case Name', 'Wind Factor', 'Barrier Factor']]
-        for case in cases['sls_cases']:
-            sls_data.append([
-                case['name'],
-                f"{case['wind_factor']:.2f}",
-                f"{case['barrier_factor']:.2f}"
-            ])
+        sls_data = (('Case Name', 'Wind Factor', 'Barrier Factor'),)
+        sls_data += tuple(
+            (case['name'], _F2(case['wind_factor']), _F2(case['barrier_factor']))
+            for case in cases['sls_cases']
+        )
         
-        table = self._create_table(sls_data, col_widths=col_widths)
-        story.append(table)
-        story.append(Spacer(1, 12))
+        return [
+            Paragraph("4. Load Cases", _STYLE_SECTION),
+            Paragraph("4.1 Ultimate Limit State (ULS)", _STYLE_SUBSECTION),
+            self._create_table(uls_data, col_widths=_COLS_CASES),
+            Spacer(1, 8),
+            Paragraph("4.2 Serviceability Limit State (SLS)", _STYLE_SUBSECTION),
+            self._create_table(sls_data, col_widths=_COLS_CASES),
+            Spacer(1, 12),
+        ]
 
-    def _add_design_criteria_section(self, story):
-        """Add design criteria section to the report."""
-        story.append(Paragraph("5. Design Criteria", self.styles['SectionHeading']))
-        
+    def _build_design_criteria_section(self):
+        """Build the design criteria section flowables for the report."""
         criteria = self.data['design_criteria']
         
-        story.append(Paragraph("5.1 Deflection Criteria", self.styles['SubsectionHeading']))
         defl = criteria['deflection']
-        defl_data = [
-            ['Parameter', 'Value', 'Units'],
-            ['Criteria Type', defl['criteria_type'], ''],
-            ['Deflection Limit', f"{defl['limit_mm']:.2f}", 'mm'],
-            ['Limit Ratio', f"span / {defl['limit_ratio']:.0f}", '']
-        ]
-        
-        col_widths = [self.content_width * 0.6, self.content_width * 0.25, self.content_width * 0.15]
-        table = self._create_table(defl_data, col_widths=col_widths)
-        story.append(table)
-        story.append(Spacer(1, 8))
+        defl_data = (
+            ('Parameter', 'Value', 'Units'),
+            ('Criteria Type', defl['criteria_type'], ''),
+            ('Deflection Limit', _F2(defl['limit_mm']), 'mm'),
+            ('Limit Ratio', "span / " + _F0(defl['limit_ratio']), '')
+        )
 
-        story.append(Paragraph("5.2 Material Safety", self.styles['SubsectionHeading']))
         safety = criteria['material_safety']
-        safety_data = [
-            ['Parameter', 'Value', 'Units'],
-            ['Safety Factor (γM)', f"{safety['safety_factor']:.2f}", ''],
-            ['Allowable Stress', f"{safety['allowable_stress_MPa']:.2f}", 'MPa'],
-        ]
+        safety_data = (
+            ('Parameter', 'Value', 'Units'),
+            ('Safety Factor (γM)', _F2(safety['safety_factor']), ''),
+            ('Allowable Stress', _F2(safety['allowable_stress_MPa']), 'MPa'),
+        )
 
-        table = self._create_table(safety_data, col_widths=col_widths)
-        story.append(table)
-        story.append(Spacer(1, 12))
+        return [
+            Paragraph("5. Design Criteria", _STYLE_SECTION),
+            Paragraph("5.1 Deflection Criteria", _STYLE_SUBSECTION),
+            self._create_table(defl_data, col_widths=_COLS_PARAM, splittable=False),
+            Spacer(1, 8),
+            Paragraph("5.2 Material Safety", _STYLE_SUBSECTION),
+            self._create_table(safety_data, col_widths=_COLS_PARAM, splittable=False),
+            Spacer(1, 12),
+        ]
     
-    def _add_uls_results_section(self, story):
-        """Add ULS results section to the report."""
-        story.append(Paragraph("6. Ultimate Limit State (ULS) Results", self.styles['SectionHeading']))
-        
+    def _build_uls_results_section(self):
+        """Build the ULS results section flowables for the report."""
         uls = self.data['uls_results']
+        gm = uls['governing_moment']
+        gs = uls['governing_shear']
         
-        story.append(Paragraph("6.1 Governing Values", self.styles['SubsectionHeading']))
-        gov_data = [
-            ['Parameter', 'Governing Case', 'Value', 'Units'],
-            ['Maximum Moment', 
-             uls['governing_moment']['case'],
-             f"{uls['governing_moment']['value_kNm']:.2f}", 'kNm'],
-            ['Maximum Shear',
-             uls['governing_shear']['case'],
-             f"{uls['governing_shear']['value_kN']:.2f}", 'kN']
-        ]
-        
-        col_widths = [self.content_width * 0.3, self.content_width * 0.3, 
-                     self.content_width * 0.2, self.content_width * 0.2]
-        table = self._create_table(gov_data, col_widths=col_widths)
-        story.append(table)
-        story.append(Spacer(1, 8))
-        
-        story.append(Paragraph("6.2 All Load Cases", self.styles['SubsectionHeading']))
-        cases_data = [['Case', 'RA (kN)', 'RB (kN)', 'M_max (kNm)', 'V_max (kN)']]
+        gov_data = (
+            ('Parameter', 'Governing Case', 'Value', 'Units'),
+            ('Maximum Moment', gm['case'], _F2(gm['value_kNm']), 'kNm'),
+            ('Maximum Shear', gs['case'], _F2(gs['value_kN']), 'kN')
+        )
         
-        for case_name, case_data in uls['reactions'].items():
-            cases_data.append([
+        cases_data = (('Case', 'RA (kN)', 'RB (kN)', 'M_max (kNm)', 'V_max (kN)'),)
+        cases_data += tuple(
+            (
                 case_name,
-                f"{case_data['RA_kN']:.2f}",
-                f"{case_data['RB_kN']:.2f}",
-                f"{case_data['M_max_kNm']:.2f}",
-                f"{case_data['V_max_kN']:.2f}"
-            ])
-        
-        col_widths = [self.content_width * 0.25, self.content_width * 0.175, 
-                     self.content_width * 0.175, self.content_width * 0.2, self.content_width * 0.2]
-        table = self._create_table(cases_data, col_widths=col_widths)
-        story.append(table)
-        story.append(Spacer(1, 12))
-
-    def _add_sls_results_section(self, story):
-        """Add SLS results section to the report."""
-        story.append(Paragraph("7. Serviceability Limit State (SLS) Results", self.styles['SectionHeading']))
+                _F2(case_data['RA_kN']),
+                _F2(case_data['RB_kN']),
+                _F2(case_data['M_max_kNm']),
+                _F2(case_data['V_max_kN'])
+            )
+            for case_name, case_data in uls['reactions'].items()
+        )
         
+        return [
+            Paragraph("6. Ultimate Limit State (ULS) Results", _STYLE_SECTION),
+            Paragraph("6.1 Governing Values", _STYLE_SUBSECTION),
+            self._create_table(gov_data, col_widths=_COLS_GOV, splittable=False),
+            Spacer(1, 8),
+            Paragraph("6.2 All Load Cases", _STYLE_SUBSECTION),
+            _CaseTableFlowable(cases_data, _COLS_ULS),
+            Spacer(1, 12),
+        ]
+
+    def _build_sls_results_section(self):
+        """Build the SLS results section flowables for the report."""
         sls = self.data['sls_results']
         
-        story.append(Paragraph("7.1 Governing Values", self.styles['SubsectionHeading']))
         # Use superscript notation that renders correctly
-        gov_data = [
-            ['Parameter', 'Value', 'Units'],
-            ['Deflection Limit', f"{sls['deflection_limit_mm']:.2f}", 'mm'],
-            ['Governing Case', sls['governing_case'], ''],
-            ['Required I', f"{sls['required_I_cm4']:.2f}", 'cm⁴'],
-        ]
-
-        col_widths = [self.content_width * 0.6, self.content_width * 0.25, self.content_width * 0.15]
-        table = self._create_table(gov_data, col_widths=col_widths)
-        story.append(table)
-        story.append(Spacer(1, 8))
+        gov_data = (
+            ('Parameter', 'Value', 'Units'),
+            ('Deflection Limit', _F2(sls['deflection_limit_mm']), 'mm'),
+            ('Governing Case', sls['governing_case'], ''),
+            ('Required I', _F2(sls['required_I_cm4']), 'cm⁴'),
+        )
 
-        story.append(Paragraph("7.2 All Load Cases", self.styles['SubsectionHeading']))
-        cases_data = [['Case', 'Required I (cm⁴)']]
-        
-        for case_name, case_data in sls['cases'].items():
-            cases_data.append([
-                case_name,
-                f"{case_data['I_req_cm4']:.2f}",
-            ])
+        cases_data = (('Case', 'Required I (cm⁴)'),)
+        cases_data += tuple(
+            (case_name, _F2(case_data['I_req_cm4']))
+            for case_name, case_data in sls['cases'].items()
+        )
         
-        col_widths = [self.content_width * 0.6, self.content_width * 0.4]
-        table = self._create_table(cases_data, col_widths=col_widths)
-        story.append(table)
-        story.append(Spacer(1, 12))
+        return [
+            Paragraph("7. Serviceability Limit State (SLS) Results", _STYLE_SECTION),
+            Paragraph("7.1 Governing Values", _STYLE_SUBSECTION),
+            self._create_table(gov_data, col_widths=_COLS_PARAM, splittable=False),
+            Spacer(1, 8),
+            Paragraph("7.2 All Load Cases", _STYLE_SUBSECTION),
+            _CaseTableFlowable(cases_data, _COLS_SLS),
+            Spacer(1, 12),
+        ]
     
-    def _add_design_requirements_section(self, story):
-        """Add design requirements summary section."""
-        story.append(Paragraph("8. Design Requirements Summary", self.styles['SectionHeading']))
-        
+    def _build_design_requirements_section(self):
+        """Build the design requirements summary section flowables."""
         req = self.data['design_requirements']
+        sm = req['section_modulus']
+        moi = req['moment_of_inertia']
         
-        data = [
-            ['Requirement', 'Governing Case', 'Required Value', 'Units'],
-            ['Section Modulus (Z)',
-             req['section_modulus']['governing_case'],
-             f"{req['section_modulus']['required_cm3']:.2f}", 'cm³'],
-            ['Moment of Inertia (I)',
-             req['moment_of_inertia']['governing_case'],
-             f"{req['moment_of_inertia']['required_cm4']:.2f}", 'cm⁴'],
-        ]
-        col_widths = [self.content_width * 0.3, self.content_width * 0.3, 
-                     self.content_width * 0.225, self.content_width * 0.175]
+        data = (
+            ('Requirement', 'Governing Case', 'Required Value', 'Units'),
+            ('Section Modulus (Z)', sm['governing_case'], _F2(sm['required_cm3']), 'cm³'),
+            ('Moment of Inertia (I)', moi['governing_case'], _F2(moi['required_cm4']), 'cm⁴'),
+        )
         
-        # Custom styling with both rows light blue
-        design_requirements_style = [
-            # Header styling
-            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#00303C')),  # TT Dark Blue header
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-            
-            # Both data rows light blue
-            ('BACKGROUND', (0, 1), (-1, 2), colors.HexColor('#CFF1F2')),  # Both rows: Light Blue
-            
-            # Alignment and fonts
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('FONTNAME', (0, 0), (-1, 0), self.font_bold),
-            ('FONTSIZE', (0, 0), (-1, 0), 10),
-            ('FONTNAME', (0, 1), (-1, -1), self.font_regular),
-            ('FONTSIZE', (0, 1), (-1, -1), 9),
-            
-            # Padding
-            ('BOTTOMPADDING', (0, 0), (-1, 0), 8),
-            ('TOPPADDING', (0, 0), (-1, 0), 8),
-            ('BOTTOMPADDING', (0, 1), (-1, -1), 6),
-            ('TOPPADDING', (0, 1), (-1, -1), 6),
-            
-            # Lines
-            ('LINEABOVE', (0, 0), (-1, 0), 1.0, colors.HexColor('#00303C')),
-            ('LINEBELOW', (0, 0), (-1, 0), 0.7, colors.HexColor('#00303C')),
-            ('LINEBELOW', (0, -1), (-1, -1), 1.0, colors.HexColor('#00303C')),
-            # Apply bold font to 2nd last column (Net pressure column) data rows only
-            ('FONTNAME', (-2, 1), (-2, -1), self.font_bold),
+        table = Table(data, colWidths=_COLS_REQ)
+        table.setStyle(_REQUIREMENTS_TABLE_STYLE)
+        table.splitByRow = 0
+        
+        return [
+            Paragraph("8. Design Requirements Summary", _STYLE_SECTION),
+            table,
+            Spacer(1, 12),
+            # Add recommendation text
+            Paragraph(
+                "<b>Section Selection:</b> Select a mullion section with properties equal to or "
+                "exceeding the required values above. Ensure that both the section modulus (Z) "
+                "and moment of inertia (I) requirements are satisfied.",
+                self._style_body
+            ),
         ]
-        
-        table = Table(data, colWidths=col_widths)
-        table.setStyle(TableStyle(design_requirements_style))
-        story.append(table)
-        story.append(Spacer(1, 12))
-        
-        # Add recommendation text
-        story.append(Paragraph(
-            "<b>Section Selection:</b> Select a mullion section with properties equal to or "
-            "exceeding the required values above. Ensure that both the section modulus (Z) "
-            "and moment of inertia (I) requirements are satisfied.",
-            self.styles['CustomBodyText']
-        ))
 
     def generate(self):
         """Generate the complete PDF report."""
@@ -514,41 +715,45 @@ class MullionDesignReport:
             bottomMargin=60
         )
 
-        story = []
-
-        # Title page
-        story.append(Spacer(1, 40))
-        story.append(Paragraph("Mullion Design Calculation Report", self.styles['CustomTitle']))
-        story.append(Spacer(1, 12))
-
-        # Report info
-        report_date = datetime.fromisoformat(self.data['metadata']['report_generated'])
-        story.append(Paragraph(
-            f"<b>Report Generated:</b> {report_date.strftime('%B %d, %Y at %H:%M')}",
-            self.styles['CustomBodyText']
-        ))
-        story.append(Paragraph(
-            f"<b>Application:</b> {self.data['metadata']['app_name']} v{self.data['metadata']['version']}",
-            self.styles['CustomBodyText']
-        ))
+        body_style = self._style_body
+
+        # Title page and report info
+        story = [
+            Spacer(1, 40),
+            Paragraph("Mullion Design Calculation Report", self.styles['CustomTitle']),
+            Spacer(1, 12),
+            Paragraph(
+                f"<b>Report Generated:</b> {self._report_date_str}",
+                body_style
+            ),
+            Paragraph(
+                f"<b>Application:</b> {self._app_label}",
+                body_style
+            ),
+        ]
         
         if self.project_name:
             story.append(Paragraph(
                 f"<b>Project:</b> {self.project_name}",
-                self.styles['CustomBodyText']
+                body_style
             ))
         
         story.append(Spacer(1, 24))
 
-        # Add all sections
-        self._add_geometry_section(story)
-        self._add_material_section(story)
-        self._add_loading_section(story)
-        self._add_load_cases_section(story)
-        self._add_design_criteria_section(story)
-        self._add_uls_results_section(story)
-        self._add_sls_results_section(story)
-        self._add_design_requirements_section(story)
+        # Add all sections. These are built serially: creating the flowables is
+        # around 1 ms even for a hundred load cases, against hundreds of ms for
+        # the layout in doc.build, and a thread pool adds overhead under the GIL
+        for build_section in (
+            self._build_geometry_section,
+            self._build_material_section,
+            self._build_loading_section,
+            self._build_load_cases_section,
+            self._build_design_criteria_section,
+            self._build_uls_results_section,
+            self._build_sls_results_section,
+            self._build_design_requirements_section,
+        ):
+            story.extend(build_section())
 
         # Build PDF
         doc.build(story, onFirstPage=self._header_footer, onLaterPages=self._header_footer)
@@ -577,11 +782,41 @@ def create_pdf_report(design_data: Dict[str, Any], project_name: Optional[str] =
     return report.generate()
 
 
+# cache_resource returns the stored bytes object itself on a hit, where
+# cache_data would unpickle a fresh copy of the whole PDF every time
+@st.cache_resource(show_spinner=False, max_entries=8)
+def cached_pdf_bytes(
+    design_key: Hashable,
+    _design_data: Dict[str, Any],
+    project_name: Optional[str] = None
+) -> bytes:
+    """
+    Build the PDF report once per unique design and return its bytes.
+
+    Parameters
+    ----------
+    design_key : Hashable
+        A stable, hashable stand-in for the design data dictionary,
+        including its generation time
+    _design_data : Dict[str, Any]
+        The design data the key was made from (not hashed by Streamlit)
+    project_name : Optional[str]
+        Project name to display in header
+
+    Returns
+    -------
+    bytes
+        The rendered PDF report
+    """
+    return create_pdf_report(_design_data, project_name).getvalue()
+
+
 def add_pdf_download_button(
     design_data: Dict[str, Any],
     filename: Optional[str] = None,
     button_label: str = "📄 Download PDF Report",
-    project_name: Optional[str] = None
+    project_name: Optional[str] = None,
+    design_key: Optional[Hashable] = None
 ):
     """
     Add a download button to the Streamlit sidebar for the PDF report.
@@ -596,6 +831,10 @@ def add_pdf_download_button(
         The label for the download button
     project_name : Optional[str]
         Project name to include in header and filename
+    design_key : Optional[Hashable]
+        Cheap, hashable identity of ``design_data`` (e.g. the inputs it was
+        built from). Defaults to its sorted JSON, which is serialized on
+        every rerun
     """
     # Generate filename if not provided
     if filename is None:
@@ -608,12 +847,30 @@ def add_pdf_download_button(
         else:
             filename = f"Mullion_Report_{timestamp}.pdf"
     
+    # Building the report is a full ReportLab layout, so it only happens once
+    # the user asks for it. It runs here in the script (not in a deferred
+    # download callable) so a failure can still be reported in the sidebar.
+    # The button only covers the design it was pressed for, and its press time
+    # is the report's generation time
+    if design_key is None:
+        design_key = json.dumps(design_data, sort_keys=True, default=str)
+    report_key = (design_key, project_name)
+    if st.sidebar.button("📝 Prepare PDF Report", width="stretch"):
+        st.session_state.pdf_report_key = report_key
+        st.session_state.pdf_report_time = datetime.now()
+    if st.session_state.get('pdf_report_key') != report_key:
+        return
+
     try:
-        pdf_buffer = create_pdf_report(design_data, project_name)
-        
+        # Reruns reuse the cached bytes. The generation time is part of the
+        # key, so no session is served another's (or an earlier) report date
+        report_time = st.session_state.pdf_report_time
+        report_data = stamp_report_generated(design_data, report_time)
+        pdf_bytes = cached_pdf_bytes((design_key, report_time), report_data, project_name)
+
         st.sidebar.download_button(
             label=button_label,
-            data=pdf_buffer,
+            data=pdf_bytes,
             file_name=filename,
             mime="application/pdf",
             help="Download complete design calculation report as PDF",